@@ -0,0 +1,79 @@
+import numpy as np
+
+class Allocation:
+    """
+    Allocation result of a transportation problem
+    Allocated cells are kept as three parallel arrays, int32 row index, int32 column index and the allocated value,
+    in the order the cells were allocated. Labels of the table (R0, C1, Dummy, ...) are only looked up when the
+    allocation is displayed or iterated as (Ri, Cj, v).
+    """
+
+    def __init__(self, trans, row, col, value):
+        self.trans = trans
+        self.row = np.asarray(row, dtype=np.int32)
+        self.col = np.asarray(col, dtype=np.int32)
+        self.value = np.asarray(value)
+
+    @classmethod
+    def from_cells(cls, trans, cells):
+        #cells as (i, j, v) index triples
+        cells = list(cells)
+        if not cells:
+            return cls(trans, [], [], np.array([], dtype=np.result_type(trans.supply, trans.demand)))
+
+        row, col, value = zip(*cells)
+        return cls(trans, row, col, np.array(value))
+
+    @classmethod
+    def from_labels(cls, trans, allocation):
+        #allocation lists of (Ri, Cj, v) as returned by earlier versions
+        rows = {label: i for i, label in enumerate(trans.row_labels)}
+        cols = {label: j for j, label in enumerate(trans.col_labels)}
+        return cls.from_cells(trans, [(rows[i], cols[j], v) for i, j, v in allocation])
+
+    @property
+    def shape(self):
+        return len(self.trans.supply), len(self.trans.demand)
+
+    def __len__(self):
+        return len(self.value)
+
+    def __iter__(self):
+        #labelled (Ri, Cj, v), same as the allocation lists
+        row_labels, col_labels = self.trans.row_labels, self.trans.col_labels
+        for i, j, v in zip(self.row.tolist(), self.col.tolist(), self.value):
+            yield [row_labels[i], col_labels[j], v]
+
+    def __repr__(self):
+        return "Allocation({} cells, total cost {})".format(len(self), self.total_cost())
+
+    def tolist(self):
+        return list(self)
+
+    def cells(self):
+        #allocated cells as (i, j, v) index triples
+        return zip(self.row.tolist(), self.col.tolist(), self.value.tolist())
+
+    def to_dense(self):
+        #(n, m) allocation matrix
+        alloc = np.zeros(self.shape, dtype=self.value.dtype)
+        alloc[self.row, self.col] = self.value
+        return alloc
+
+    def to_sparse(self):
+        #(n, m) scipy.sparse coo matrix, scipy is only needed here
+        from scipy.sparse import coo_matrix
+        return coo_matrix((self.value, (self.row, self.col)), shape=self.shape)
+
+    def cell_cost(self):
+        #unit cost of every allocated cell
+        if not self.trans.is_sparse:
+            return self.trans.cost[self.row, self.col]
+
+        #arcs are in row-wise order, find the lanes by their flat index,
+        #artificial cells on forbidden lanes (see AllocationEngine.artificial) cost big-M
+        lane, allowed = self.trans.lanes(self.row, self.col)
+        return np.where(allowed, self.trans.arc_cost[lane], self.trans.big_m())
+
+    def total_cost(self):
+        return (self.value * self.cell_cost()).sum()
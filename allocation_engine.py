@@ -0,0 +1,228 @@
+import numpy as np
+from time import perf_counter
+from allocation import Allocation
+
+class AllocationEngine:
+    """
+    Shared allocation engine for the initial basic feasible solution methods.
+    The cost matrix keeps it's original shape during the whole solve, crossed out (striked) rows and columns
+    are tracked with boolean masks instead of being deleted from the table.
+    Each method only has to pick the next cell (x, y) in the original index of the table and yield allocate(x, y)
+    from iter_allocations, so allocations can be consumed while the method is still solving.
+    Methods that work on the allowed lanes (arcs) of a sparse problem set sparse = True, the others need a dense cost.
+    When no allowed lane joins the uncrossed rows and columns they allocate on an artificial lane (see artificial).
+    Methods that never change the cost set work_cost = False and read the cost of the problem without a working copy.
+    on_iteration(event) is called after every allocation with the iteration number, allocated cell and value,
+    number of uncrossed rows/columns and the time spent selecting the cell and updating after it (see profile).
+    """
+
+    sparse = False
+    work_cost = True
+
+    def __init__(self, trans, on_iteration=None):
+        self.trans = trans
+        self.on_iteration = on_iteration
+
+        if trans.is_sparse and not self.sparse:
+            raise TypeError("{} needs a dense cost matrix".format(type(self).__name__))
+
+        #working copy of the problem, methods that reduce or weight the cost change this copy only
+        if trans.is_sparse:
+            self.cost = None
+        elif self.work_cost:
+            self.cost = np.array(trans.cost, dtype=float)
+        else:
+            self.cost = trans.cost
+        self.supply = trans.supply.copy()
+        self.demand = trans.demand.copy()
+
+        #uncrossed rows and columns
+        self.rows = np.ones(len(self.supply), dtype=bool)
+        self.cols = np.ones(len(self.demand), dtype=bool)
+
+        self.alloc = []
+
+    @property
+    def table(self):
+        #table of uncrossed rows and columns, only used for printing
+        cost = self.trans.dense_cost(fill='-') if self.cost is None else self.cost
+        return self.trans.build_table(cost, self.supply, self.demand, *self.live())
+
+    def live(self):
+        #index of uncrossed rows and columns
+        return np.flatnonzero(self.rows), np.flatnonzero(self.cols)
+
+    def is_solved(self):
+        return not (self.rows.any() and self.cols.any())
+
+    def row_min(self, x):
+        #column of the smallest uncrossed cost of row x, the first one on ties
+        return int(np.argmin(np.where(self.cols, self.cost[x], np.inf)))
+
+    def col_min(self, y):
+        #row of the smallest uncrossed cost of column y, the first one on ties
+        return int(np.argmin(np.where(self.rows, self.cost[:, y], np.inf)))
+
+    def strike(self, x, y):
+        #fill the lines crossed out by allocating (x, y) with inf in the working cost,
+        #for methods that keep crossed cells out of their minima this way instead of masking every reduction
+        if not self.rows[x]:
+            self.cost[x] = np.inf
+        if not self.cols[y]:
+            self.cost[:, y] = np.inf
+
+    def next_live(self, row, col, p, block=64):
+        #first cell at or after p of a fixed order (row, col arrays) whose row and column are uncrossed,
+        #crossed cells are skipped block by block
+        while p < len(row):
+            live = self.rows[row[p:p + block]] & self.cols[col[p:p + block]]
+            if live.any():
+                return p + int(np.argmax(live))
+            p += block
+            block *= 2
+        return len(row)
+
+    def artificial(self):
+        #uncrossed rows/columns are left but none of their lanes, allocate on the forbidden lane of the first
+        #uncrossed row and column as a last resort. it costs big-M (Transportation.big_m) and MODI / network simplex
+        #drive it out again, they only raise if the problem has no feasible allocation on the allowed lanes
+        return int(np.argmax(self.rows)), int(np.argmax(self.cols))
+
+    def allocate(self, x, y):
+
+        if self.on_iteration is not None:
+            #end of selection
+            self.selected = perf_counter()
+
+        mins = min([self.supply[x], self.demand[y]])
+
+        self.supply[x] -= mins
+        self.demand[y] -= mins
+
+        if self.supply[x] == 0:
+            #supply x is exhausted, cross out row x
+            self.rows[x] = False
+
+        if self.demand[y] == 0:
+            #demand y is satisfied, cross out column y
+            self.cols[y] = False
+
+        return x, y, mins
+
+    def iter_allocations(self, show_iter=False):
+        #yield allocation (i, j, v) as soon as it's decided, i and j are row and column index of the table
+        raise NotImplementedError
+
+    def iterate(self, show_iter=False, **kwargs):
+        #allocations of the method, profiled when on_iteration is set
+        allocations = self.iter_allocations(show_iter=show_iter, **kwargs)
+        if self.on_iteration is None:
+            return allocations
+        return self.profile(allocations)
+
+    def profile(self, allocations):
+        #select_time runs from resuming the method until it calls allocate(x, y),
+        #update_time from there until the allocation is yielded (allocate and the method's own updates before yielding)
+        iteration = 0
+        while True:
+            start = perf_counter()
+            try:
+                x, y, v = next(allocations)
+            except StopIteration:
+                return
+            end = perf_counter()
+
+            #allocation made before this step (e.g. Karagul-Sahin yields after solving both passes)
+            selected = self.selected if start <= self.selected <= end else end
+
+            self.on_iteration({
+                "method": type(self).__name__,
+                "iteration": iteration,
+                "row": int(x),
+                "col": int(y),
+                "value": v.item() if hasattr(v, "item") else v,
+                "live_rows": int(self.rows.sum()),
+                "live_cols": int(self.cols.sum()),
+                "select_time": selected - start,
+                "update_time": end - selected,
+            })
+            iteration += 1
+
+            yield x, y, v
+
+    def solve(self, show_iter=False, **kwargs):
+        #collect every allocation, keyword arguments go to iter_allocations of the method
+        self.alloc = Allocation.from_cells(self.trans, self.iterate(show_iter=show_iter, **kwargs))
+        return self.alloc
+
+
+class ReducedCostEngine(AllocationEngine):
+    """
+    Shared engine of the methods allocating on the zeros of a row and column reduced cost (ASM, IEA).
+    Crossed out lines are infinite in the working cost (see strike), so plain minima and zero tests only see uncrossed cells.
+    A zero is scored by the other zeros in it's row and column (minimum first), ties go to the maximum sum of it's row
+    and column, then to the minimum average of it's supply and demand.
+    """
+
+    def reduce_rows(self):
+        #subtract the minimum of every uncrossed row, in place, crossed cells are infinite and stay so
+        mins = np.min(self.cost, 1)
+        mins[~self.rows] = 0
+        self.cost -= mins.reshape(-1, 1)
+
+    def reduce_cols(self):
+        #subtract the minimum of every uncrossed column, in place, crossed cells are infinite and stay so
+        mins = np.min(self.cost, 0)
+        mins[~self.cols] = 0
+        self.cost -= mins
+
+    def select_index(self):
+        #zeros of the uncrossed cells (crossed ones are infinite), in row major order
+        is_zero = self.cost == 0
+        zeros = np.argwhere(is_zero)
+        n = zeros.shape[0]
+        x, y = zeros.T
+
+        #other zeros in the row and column of each zero and average of it's rim values
+        a = (is_zero.sum(1)[x] - 1) + (is_zero.sum(0)[y] - 1)
+        c = (self.supply[x] + self.demand[y]) / 2
+
+        mask = a == a.min()
+        if mask.sum() > 1:
+
+            #sum of the uncrossed cells of it's row and column, only needed on ties
+            row_sums = np.sum(self.cost, 1, where=self.cols)
+            col_sums = np.sum(self.cost, 0, where=self.rows.reshape(-1, 1))
+            b = row_sums[x] + col_sums[y]
+
+            select = np.zeros(n)
+            select[mask] = b[mask]
+
+            mask &= b == b.max()
+            if mask.sum() > 1:
+
+                select = np.full(n, np.inf)
+                select[mask] = c[mask]
+                x, y = zeros[np.argmin(select)]
+            else:
+                x, y = zeros[np.argmax(select)]
+        else:
+            x, y = zeros[np.argmin(a)]
+
+        return x, y
+
+    def iter_zeros(self, show_iter=False):
+        #reduce the cost and allocate on the selected zero until every supply and demand is met
+        while not self.is_solved():
+
+            self.reduce_rows()
+            self.reduce_cols()
+            x, y = self.select_index()
+
+            #crossed out lines are infinite in the working cost, so they never are a minimum or zero again
+            x, y, v = self.allocate(x, y)
+            self.strike(x, y)
+            yield x, y, v
+
+            if show_iter:
+                self.trans.print_frame(self.table)
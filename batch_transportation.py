@@ -0,0 +1,154 @@
+import numpy as np
+
+class BatchTransportation:
+    """
+    Batch of k transportation problems with the same shape, solved together.
+    cost is a (k, n, m) array, supply a (k, n) array and demand a (k, m) array.
+    Every problem gets a dummy row and a dummy column (zero cost) at the end, only the one needed to balance the problem
+    has positive supply/demand, the other is crossed out from the start.
+    Problems of different shapes can be padded to the same one, rows (k, n) and cols (k, m) are boolean masks of the lines
+    belonging to each problem (default all), padding lines are crossed out from the start too. Other lines with zero
+    supply/demand stay uncrossed until they get their (zero) allocation, like in the single problem classes.
+    Each step of a method picks one cell of every unsolved problem with array operations over the batch axis,
+    following the same selection and tie breaking rules as the single problem classes.
+    """
+
+    def __init__(self, cost, supply, demand, rows=None, cols=None):
+
+        self.k, self.n, self.m = cost.shape
+
+        #lines of the problems, the others are padding
+        self.real_rows = np.ones((self.k, self.n), dtype=bool) if rows is None else np.asarray(rows, dtype=bool)
+        self.real_cols = np.ones((self.k, self.m), dtype=bool) if cols is None else np.asarray(cols, dtype=bool)
+
+        self.cost = np.zeros((self.k, self.n + 1, self.m + 1))
+        self.cost[:, :-1, :-1] = cost
+
+        #sum(supply) - sum(demand) of every problem
+        gap = supply.sum(1) - demand.sum(1)
+        self.supply = np.hstack([supply, np.maximum(-gap, 0).reshape(-1, 1)])
+        self.demand = np.hstack([demand, np.maximum(gap, 0).reshape(-1, 1)])
+
+        self.methods = {
+            "nwc": self.north_west_corner,
+            "lcm": self.least_cost,
+            "vam": self.vogels_approximation,
+            "russell": self.russells_approximation,
+        }
+
+    def live_cost(self, cost, fill=np.inf):
+        #cost with crossed out cells replaced by fill
+        live = self.rows[:, :, None] & self.cols[:, None, :]
+        return np.where(live, cost, fill)
+
+    def north_west_corner(self):
+        #first uncrossed row and column
+        return np.argmax(self.rows, 1), np.argmax(self.cols, 1)
+
+    def least_cost(self):
+        #minimum cost cell, tie is broken by maximum allocation then row-wise order
+        cost = self.live_cost(self.cost)
+        mins = cost == cost.min((1, 2), keepdims=True)
+
+        alloc = np.minimum(self.supply[:, :, None], self.demand[:, None, :])
+        alloc = np.where(mins, alloc, -1).reshape(self.k, -1)
+        return np.unravel_index(np.argmax(alloc, 1), self.cost.shape[1:])
+
+    def penalty(self, cost):
+        #gaps between two lowest cost in each row, a row with one cost left has it as penalty
+        low = np.partition(cost, 1, axis=2)[:, :, :2]
+        with np.errstate(invalid='ignore'):
+            return np.where(np.isinf(low[:, :, 1]), np.abs(low[:, :, 0]), low[:, :, 1] - low[:, :, 0])
+
+    def vogels_approximation(self):
+        cost = self.live_cost(self.cost)
+        costT = cost.transpose(0, 2, 1)
+
+        #row and column penalties of uncrossed lines
+        row_penalty = np.where(self.rows, self.penalty(cost), -np.inf)
+        col_penalty = np.where(self.cols, self.penalty(costT), -np.inf)
+
+        P = np.hstack([row_penalty, col_penalty])
+        maxs = P.max(1, keepdims=True)
+        row_max = (row_penalty == maxs)[:, :, None]
+        col_max = (col_penalty == maxs)[:, :, None]
+
+        #minimum cost cells of maximum penalty lines with their allocation,
+        #ordered like the single problem: rows then columns, each line in index order
+        alloc = np.minimum(self.supply[:, :, None], self.demand[:, None, :])
+        row_alloc = np.where(row_max & (cost == cost.min(2, keepdims=True)), alloc, -np.inf)
+        col_alloc = np.where(col_max & (costT == costT.min(2, keepdims=True)), alloc.transpose(0, 2, 1), -np.inf)
+
+        n, m = cost.shape[1:]
+        select = np.argmax(np.hstack([row_alloc.reshape(self.k, -1), col_alloc.reshape(self.k, -1)]), 1)
+        x, y = np.divmod(select, m)
+        cols = select >= n * m
+        y[cols], x[cols] = np.divmod(select[cols] - n * m, n)
+        return x, y
+
+    def russells_approximation(self):
+        cost = self.live_cost(self.cost, -np.inf)
+
+        #compute U and V over uncrossed cells
+        U = cost.max(2, keepdims=True)
+        V = cost.max(1, keepdims=True)
+
+        #find the most negative delta = cost - V - U against the original cost
+        with np.errstate(invalid='ignore'):
+            delta = self.live_cost(self.cost - V - U)
+        return np.unravel_index(np.argmin(delta.reshape(self.k, -1), 1), self.cost.shape[1:])
+
+    def allocate(self, x, y):
+        #allocate cell (x, y) of every unsolved problem
+        b = np.flatnonzero(self.rows.any(1) & self.cols.any(1))
+        x, y = x[b], y[b]
+
+        mins = np.minimum(self.supply[b, x], self.demand[b, y])
+        self.alloc[b, x, y] += mins
+        self.supply[b, x] -= mins
+        self.demand[b, y] -= mins
+
+        #cross out exhausted rows and satisfied columns
+        self.rows[b, x] &= self.supply[b, x] != 0
+        self.cols[b, y] &= self.demand[b, y] != 0
+
+    def solve(self, method="vam"):
+
+        select = self.methods[method]
+
+        #working copies, supply and demand are used up by the allocations
+        supply, demand = self.supply, self.demand
+        self.supply, self.demand = supply.copy(), demand.copy()
+        #padding lines and the dummy line that isn't needed start crossed out
+        self.rows = np.hstack([self.real_rows, self.supply[:, -1:] > 0])
+        self.cols = np.hstack([self.real_cols, self.demand[:, -1:] > 0])
+        self.alloc = np.zeros(self.cost.shape, dtype=np.result_type(supply, demand))
+
+        while (self.rows.any(1) & self.cols.any(1)).any():
+            self.allocate(*select())
+
+        self.supply, self.demand = supply, demand
+
+        #drop dummy row and column
+        alloc = self.alloc[:, :-1, :-1]
+        total = (alloc * self.cost[:, :-1, :-1]).sum((1, 2))
+        return alloc, total
+
+
+if __name__ == "__main__":
+
+    #batch of 10000 random 10x20 problems
+    rng = np.random.default_rng(0)
+    cost = rng.integers(1, 100, (10000, 10, 20))
+    supply = rng.integers(10, 100, (10000, 10))
+    demand = rng.integers(10, 100, (10000, 20))
+
+    #initialize batch of transportation problem
+    batch = BatchTransportation(cost, supply, demand)
+
+    #solve every problem with method "nwc", "lcm", "vam" or "russell".
+    #return allocation tensor (k, n, m), allocation of dummy row/column is dropped,
+    #and total cost of each problem.
+    for method in ["nwc", "lcm", "vam", "russell"]:
+        alloc, total = batch.solve(method=method)
+        print("{} AVERAGE TOTAL COST: {}".format(method.upper(), total.mean()))
@@ -0,0 +1,211 @@
+import sys
+import json
+import time
+import platform
+import argparse
+import tracemalloc
+import numpy as np
+import multiprocessing as mp
+from multiprocessing.connection import wait
+from transportation import Transportation
+from registry import names, lookup, get, class_name
+from network_simplex import NetworkSimplex
+
+METHODS = names()
+KINDS = ["uniform", "clustered", "euclidean"]
+SIZES = [5, 20, 100, 500, 2000]
+
+
+def make_problem(n, m, kind="uniform", balanced=True, seed=0):
+    #reproducible random problem, same arguments always give the same cost, supply and demand
+    rng = np.random.default_rng([seed, n, m, KINDS.index(kind), int(balanced)])
+
+    if kind == "uniform":
+        cost = rng.integers(1, 101, (n, m))
+
+    elif kind == "clustered":
+        #sources and destinations in a few clusters, cost between clusters plus small noise
+        k = max(min(n, m) // 10, 2)
+        base = rng.integers(1, 101, (k, k))
+        cost = base[np.ix_(rng.integers(0, k, n), rng.integers(0, k, m))] + rng.integers(0, 10, (n, m))
+
+    elif kind == "euclidean":
+        #rounded distance between random points of a 100 x 100 square
+        src, dst = rng.random((n, 2)) * 100, rng.random((m, 2)) * 100
+        cost = np.rint(np.hypot(*(src[:, None] - dst[None]).transpose(2, 0, 1))).astype(int) + 1
+
+    else:
+        raise ValueError("unknown cost distribution {}".format(kind))
+
+    supply = rng.integers(10, 101, n)
+
+    #demand shares total supply (80% of it if unbalanced), every destination gets at least 1
+    total = max(supply.sum() if balanced else int(supply.sum() * 0.8), m)
+    demand = 1 + rng.multinomial(total - m, rng.dirichlet(np.ones(m)))
+
+    return cost, supply, demand
+
+
+def setup(problem):
+    trans = Transportation(*problem)
+    trans.setup_table(minimize=True)
+    return trans
+
+
+def measure(method, params):
+    #wall time of a solve, then peak traced memory of a second solve (tracing slows it down),
+    #params are the arguments of make_problem
+    method = get(method)
+    problem = make_problem(*params)
+    trans = setup(problem)
+    start = time.perf_counter()
+    alloc = method(trans).solve()
+    seconds = time.perf_counter() - start
+
+    trans = setup(problem)
+    tracemalloc.start()
+    method(trans).solve()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "seconds": seconds,
+        "peak_mb": peak / 2**20,
+        "iterations": len(alloc),
+        "total_cost": float(alloc.total_cost()),
+    }
+
+
+def optimum(params):
+    #optimal cost by network simplex warm started from VAM, params are the arguments of make_problem
+    trans = setup(make_problem(*params))
+    NS = NetworkSimplex(trans)
+    start = time.perf_counter()
+    alloc = NS.solve(initial="vam")
+
+    return {
+        "seconds": time.perf_counter() - start,
+        "pivots": NS.pivots,
+        "total_cost": float(alloc.total_cost()),
+    }
+
+
+def run_task(task, args, conn):
+    #worker process, the problem is made again from its parameters instead of being sent
+    try:
+        conn.send(("ok", task(*args)))
+    except Exception as e:
+        conn.send(("error", repr(e)))
+    finally:
+        conn.close()
+
+
+class Benchmark:
+    """
+    Benchmark of the initial solution methods
+    Every method is run on reproducible random problems of each size, cost distribution (uniform, clustered, euclidean)
+    and balance, each run in its own worker process with a timeout. A run records wall time, peak traced memory,
+    number of allocations (iterations), total cost and gap to the optimal cost found by network simplex.
+    """
+
+    def __init__(self, sizes=SIZES, kinds=KINDS, balanced=(True, False), methods=METHODS, seed=0, timeout=60):
+        self.sizes = list(sizes)
+        self.kinds = list(kinds)
+        self.balanced = list(balanced)
+        self.methods = list(methods)
+        self.seed = seed
+        self.timeout = timeout
+
+        self.results = []
+
+    def instances(self):
+        for n in self.sizes:
+            for kind in self.kinds:
+                for balanced in self.balanced:
+                    yield {"n": n, "m": n, "kind": kind, "balanced": balanced, "seed": self.seed}
+
+    def run_process(self, task, args):
+        #run task in a worker process, (status, value) where status is "ok", "error" or "timeout"
+        recv, send = mp.Pipe(duplex=False)
+        proc = mp.Process(target=run_task, args=(task, args, send), daemon=True)
+        proc.start()
+        send.close()
+
+        try:
+            if wait([recv], timeout=self.timeout):
+                try:
+                    return recv.recv()
+                except EOFError:
+                    proc.join()
+                    return "error", "worker exited with code {}".format(proc.exitcode)
+
+            proc.terminate()
+            return "timeout", None
+        finally:
+            proc.join()
+            recv.close()
+
+    def run(self, show_iter=False):
+
+        for params in self.instances():
+            #only the (n, m, kind, balanced, seed) parameters are sent to the workers
+            problem = (params["n"], params["m"], params["kind"], params["balanced"], params["seed"])
+
+            status, opt = self.run_process(optimum, (problem,))
+            best = opt["total_cost"] if status == "ok" else None
+
+            for method in self.methods:
+                status, value = self.run_process(measure, (method, problem))
+
+                record = dict(params, method=class_name(method), status=status)
+                if status == "ok":
+                    record.update(value)
+                    record["optimal_cost"] = best
+                    record["gap"] = None if not best else (value["total_cost"] - best) / best
+                elif status == "error":
+                    record["error"] = value
+                self.results.append(record)
+
+                if show_iter:
+                    gap = "gap {:.2%}".format(record["gap"]) if record.get("gap") is not None else ""
+                    print("{n}x{m} {kind:9} {balanced!s:5} {method:30} {status:7}".format(**record), gap)
+
+        return self.results
+
+    def save(self, path):
+        #results with the environment they were measured in
+        meta = {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": self.seed,
+            "timeout": self.timeout,
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        with open(path, "w") as f:
+            json.dump({"meta": meta, "results": self.results}, f, indent=1)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="benchmark of the initial solution methods")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--kinds", nargs="+", choices=KINDS, default=KINDS)
+    parser.add_argument("--methods", nargs="+", help="registry names (vam, russell, ...) or class names, default all")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60, help="seconds given to each run")
+    parser.add_argument("--out", default="benchmark.json")
+    args = parser.parse_args()
+
+    methods = METHODS
+    if args.methods:
+        try:
+            methods = [lookup(name) for name in args.methods]
+        except KeyError as e:
+            sys.exit(e.args[0])
+
+    #run every method on every problem and write results to a json file,
+    #e.g. python benchmark.py --sizes 5 100 --kinds uniform --timeout 10 --out benchmark.json
+    bench = Benchmark(sizes=args.sizes, kinds=args.kinds, methods=methods, seed=args.seed, timeout=args.timeout)
+    bench.run(show_iter=True)
+    bench.save(args.out)
@@ -0,0 +1,232 @@
+import os
+import sys
+import json
+import time
+import argparse
+import numpy as np
+import registry
+from transportation import Transportation
+
+#input files read as problems, others in a directory are skipped
+SUFFIXES = [".csv", ".npy", ".npz", ".json", ".jsonl"]
+
+#allocation file formats, a --out file ending with .jsonl gets every allocation as one line instead
+FORMATS = ["csv", "npz", "json"]
+
+
+def integral(a):
+    #a as int64 if every value is a whole number, fractional values are kept as floats instead of being truncated
+    if np.issubdtype(a.dtype, np.floating) and np.all(np.isfinite(a)) and np.all(a == np.rint(a)):
+        return a.astype(np.int64)
+    return a
+
+
+def from_table(table):
+    #cost, supply and demand of a transportation table, supply is the last column and demand the last row
+    table = np.asarray(table)
+    if table.ndim != 2 or min(table.shape) < 2:
+        raise ValueError("table needs at least one cost row and column with supply and demand, got shape {}".format(table.shape))
+
+    supply, demand = table[:-1, -1], table[-1, :-1]
+    if not (np.all(np.isfinite(supply)) and np.all(np.isfinite(demand))):
+        raise ValueError("supply and demand of the table need a value in every row and column")
+
+    return integral(table[:-1, :-1]), integral(supply), integral(demand)
+
+
+def from_record(record):
+    #cost, supply and demand of a json object
+    return np.array(record["cost"]), np.array(record["supply"]), np.array(record["demand"])
+
+
+def from_records(records, on_error=None):
+    #yield (name, cost, supply, demand) of (default name, json object or line) pairs,
+    #a malformed record is passed to on_error(name, error) and skipped, without on_error it's raised
+    for default, record in records:
+        try:
+            if isinstance(record, str):
+                record = json.loads(record)
+            problem = (record.get("name", default),) + from_record(record)
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            if on_error is None:
+                raise
+            on_error(default, e)
+            continue
+        yield problem
+
+
+def read_file(path, name, on_error=None):
+    #yield (name, cost, supply, demand) of every problem in a file, one at a time,
+    #a malformed record of a json or jsonl file goes to on_error (see from_records) and the next one is read
+    suffix = os.path.splitext(path)[1].lower()
+
+    if suffix == ".csv":
+        #table layout, the corner (total supply) may be left empty
+        yield (name,) + from_table(np.genfromtxt(path, delimiter=",", ndmin=2))
+
+    elif suffix == ".npy":
+        yield (name,) + from_table(np.load(path))
+
+    elif suffix == ".npz":
+        with np.load(path) as data:
+            if "cost" in data:
+                yield name, data["cost"], data["supply"], data["demand"]
+            else:
+                yield (name,) + from_table(data[data.files[0]])
+
+    elif suffix == ".json":
+        with open(path) as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = [data]
+        yield from from_records(((name if len(data) == 1 else "{}/{}".format(name, k), record) for k, record in enumerate(data)), on_error)
+
+    elif suffix == ".jsonl":
+        #one problem per line, read line by line
+        with open(path) as f:
+            yield from from_records((("{}/{}".format(name, k), line) for k, line in enumerate(f) if line.strip()), on_error)
+
+    else:
+        raise ValueError("unknown problem file {}, expected one of {}".format(path, ", ".join(SUFFIXES)))
+
+
+def problem_files(paths):
+    #yield (path, name) of the given files and of the problem files in the given directories (recursively, in sorted order),
+    #name is the path relative to the given directory without suffix
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path, os.path.splitext(os.path.basename(path))[0]
+            continue
+
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for file in sorted(files):
+                stem, suffix = os.path.splitext(file)
+                if suffix.lower() in SUFFIXES:
+                    yield os.path.join(root, file), os.path.relpath(os.path.join(root, stem), path).replace(os.sep, "/")
+
+
+def read_problems(paths, on_error=None):
+    #yield (name, cost, supply, demand) of every problem in files and directories, one at a time
+    for path, name in problem_files(paths):
+        yield from read_file(path, name, on_error)
+
+
+def solve(cost, supply, demand, method="vam", optimal=False, minimize=True):
+    #allocated cells (row, col, value) of the problem, without dummy row/column, and their total cost
+    trans = Transportation(cost, supply, demand)
+    trans.setup_table(minimize=minimize)
+
+    if optimal:
+        #network simplex is only imported when a problem is solved to optimality
+        from network_simplex import NetworkSimplex
+        alloc = NetworkSimplex(trans).solve(initial=method)
+    else:
+        alloc = registry.solve(method, trans)
+
+    #cells of the dummy row/column are the unallocated supply or demand
+    n, m = cost.shape
+    real = (alloc.row < n) & (alloc.col < m)
+    row, col, value = alloc.row[real], alloc.col[real], alloc.value[real]
+
+    return row, col, value, (value * cost[row, col]).sum().item()
+
+
+def result(name, method, optimal, row, col, value, total, seconds):
+    #json lines record of one allocation, optimal tells if network simplex improved the method's allocation
+    return {
+        "name": name,
+        "method": method,
+        "optimal": optimal,
+        "total_cost": total,
+        "seconds": seconds,
+        "row": row.tolist(),
+        "col": col.tolist(),
+        "value": value.tolist(),
+    }
+
+
+def write_allocation(path, row, col, value, total, fmt="csv"):
+    #allocation file of one problem, cells as (row, col, value)
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+
+    if fmt == "csv":
+        np.savetxt(path, np.column_stack([row, col, value]), fmt="%s", delimiter=",", header="row,col,value", comments="")
+    elif fmt == "npz":
+        np.savez_compressed(path, row=row, col=col, value=value, total_cost=total)
+    elif fmt == "json":
+        with open(path, "w") as f:
+            json.dump({"total_cost": total, "row": row.tolist(), "col": col.tolist(), "value": value.tolist()}, f)
+    else:
+        raise ValueError("unknown allocation format {}, expected one of {}".format(fmt, ", ".join(FORMATS)))
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="solve transportation problems from csv, npy, npz, json or jsonl files and directories")
+    parser.add_argument("inputs", nargs="+", help="problem files or directories of them")
+    parser.add_argument("--method", default="vam", help="initial solution method, registry name (vam, russell, lcm, ...) or class name")
+    parser.add_argument("--optimal", action="store_true", help="solve to optimality with network simplex warm started from --method")
+    parser.add_argument("--maximize", action="store_true", help="maximize total cost instead of minimizing it")
+    parser.add_argument("--out", help="directory of allocation files, or a .jsonl file of all allocations")
+    parser.add_argument("--format", choices=FORMATS, default="csv", help="allocation file format in an --out directory")
+    parser.add_argument("--quiet", action="store_true", help="don't print total cost of every problem")
+    args = parser.parse_args(argv)
+
+    try:
+        method = registry.lookup(args.method)
+    except KeyError as e:
+        parser.error(e.args[0])
+
+    #a single json lines file of every allocation, or one allocation file per problem
+    lines = open(args.out, "w") if args.out and args.out.endswith(".jsonl") else None
+
+    solved, failed = 0, 0
+
+    def skip(name, e):
+        #malformed record, the next records of it's file are still solved
+        nonlocal failed
+        print("{}: {!r}".format(name, e), file=sys.stderr)
+        failed += 1
+
+    try:
+        for path, name in problem_files(args.inputs):
+            try:
+                for name, cost, supply, demand in read_file(path, name, skip):
+                    try:
+                        start = time.perf_counter()
+                        row, col, value, total = solve(cost, supply, demand, method, args.optimal, not args.maximize)
+                        seconds = time.perf_counter() - start
+                    except Exception as e:
+                        print("{}: {!r}".format(name, e), file=sys.stderr)
+                        failed += 1
+                        continue
+
+                    if lines is not None:
+                        lines.write(json.dumps(result(name, registry.class_name(method), args.optimal, row, col, value, total, seconds)) + "\n")
+                    elif args.out:
+                        write_allocation(os.path.join(args.out, "{}.{}".format(name, args.format)), row, col, value, total, args.format)
+
+                    if not args.quiet:
+                        print("{} {} {:.6f}s".format(name, total, seconds))
+                    solved += 1
+
+            except (OSError, ValueError, KeyError) as e:
+                #unreadable file, the other files are still solved
+                print("{}: {!r}".format(path, e), file=sys.stderr)
+                failed += 1
+    finally:
+        if lines is not None:
+            lines.close()
+
+    print("{} solved, {} failed".format(solved, failed), file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+
+    #solve every problem of a directory with Vogel's approximation, writing one csv allocation per problem,
+    #e.g. python cli.py problems/ --method vam --out allocations/
+    #or to optimality with every allocation in one json lines file,
+    #e.g. python cli.py problems.jsonl --optimal --out allocations.jsonl
+    sys.exit(main())
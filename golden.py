@@ -0,0 +1,417 @@
+import os
+import sys
+import json
+import tempfile
+import argparse
+import subprocess
+import numpy as np
+from transportation import Transportation
+import registry
+from registry import names, lookup, get, class_name
+
+METHODS = names()
+
+PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "golden.json")
+
+#problem instances as (cost, supply, demand), the examples at the bottom of each module
+#and small random problems with many equal costs where tie breaking decides the allocation
+PROBLEMS = {
+    #example 1 of assigning_shortest_minimax
+    "asm_balance": (
+        [[11, 13, 17, 14],
+         [16, 18, 14, 10],
+         [21, 24, 13, 10]],
+        [250, 300, 400],
+        [200, 225, 275, 250]),
+    #example 2 of assigning_shortest_minimax
+    "asm_unbalance": (
+        [[ 2,  7, 14],
+         [ 3,  3,  1],
+         [ 5,  4,  7],
+         [ 1,  6,  2]],
+        [5, 8, 7, 15],
+        [7, 9, 18]),
+    #example 1 of average_total_opprtunity_cost
+    "atoc_balance": (
+        [[9, 8, 5, 7],
+         [4, 6, 8, 7],
+         [5, 8, 9, 5]],
+        [12, 14, 16],
+        [8, 18, 13, 3]),
+    #example 2 of most modules
+    "example_unbalance": (
+        [[ 4,  8,  8],
+         [16, 24, 16],
+         [ 8, 16, 24]],
+        [76, 82, 77],
+        [72, 102, 41]),
+    #example 1 of most modules
+    "example_balance": (
+        [[19, 30, 50, 10],
+         [70, 30, 40, 60],
+         [40,  8, 70, 20]],
+        [7, 9, 18],
+        [5, 8, 7, 14]),
+    #example 1 of global_minium_method
+    "gm_balance": (
+        [[15,  4,  6, 15],
+         [ 5,  2, 15,  4],
+         [ 6,  5,  3, 14]],
+        [70, 47, 33],
+        [52, 78, 15, 5]),
+    #example 2 of global_minium_method
+    "gm_unbalance": (
+        [[ 6,  1,  9,  3],
+         [11,  5,  2,  8],
+         [10, 12,  4,  7]],
+        [70, 55, 70],
+        [85, 35, 50, 45]),
+    #example 1 of harmonic_mean_approach, the_adavanced_method
+    "hma_balance": (
+        [[489, 350, 142, 365, 424, 272, 272],
+         [272, 410, 350, 489, 365, 489, 253],
+         [424, 489, 365, 253, 410, 410, 142],
+         [365, 257, 472, 272, 350, 410, 142],
+         [350, 272, 365, 472, 410, 257, 272]],
+        [2314, 2628, 2493, 2268, 2398],
+        [1900, 1778, 1694, 1851, 1959, 1838, 1081]),
+    #example 2 of harmonic_mean_approach, the_adavanced_method
+    "hma_unbalance": (
+        [[ 60, 120,  75, 180],
+         [ 58, 100,  60, 165],
+         [ 62, 110,  65, 170],
+         [ 65, 115,  80, 175],
+         [ 70, 135,  85, 195]],
+        [8000, 9200, 6250, 4900, 6100],
+        [5000, 2000, 10000, 6000]),
+    #example 1 of improved_exponential_approach
+    "iea_balance": (
+        [[73, 40,  9, 79, 20],
+         [62, 93, 96,  8, 13],
+         [96, 65, 80, 50, 65],
+         [57, 58, 29, 12, 87],
+         [56, 23, 87, 18, 12]],
+        [8, 7, 9, 3, 5],
+        [6, 8, 10, 4, 4]),
+    #example 2 of improved_exponential_approach
+    "iea_unbalance": (
+        [[10,  2, 16, 14, 10],
+         [ 6, 18, 12, 13, 16],
+         [ 8,  4, 14, 12, 10],
+         [14, 22, 20,  8, 18]],
+        [300, 500, 825, 375],
+        [350, 400, 250, 150, 400]),
+    #example 1 of karagul_sahin_approximation
+    "ks_balance": (
+        [[ 6,  8, 10],
+         [ 7, 11, 11],
+         [ 7,  5, 12]],
+        [150, 175, 275],
+        [200, 100, 300]),
+    #example 2 of karagul_sahin_approximation
+    "ks_unbalance": (
+        [[390, 380, 500],
+         [290, 280, 400],
+         [240, 230, 350]],
+        [30000, 40000, 60000],
+        [20000, 30000, 30000]),
+    #example 1 of maximum_devide_minimum_allotment
+    "mdma_balance": (
+        [[12,  4,  9,  5,  9],
+         [ 8,  1,  6,  6,  7],
+         [ 1, 12,  4,  7,  7],
+         [10, 15,  6,  9,  1]],
+        [55, 45, 30, 50],
+        [40, 20, 50, 30, 40]),
+    #random 4x6 with many equal costs
+    "ties_1": (
+        [[1, 2, 2, 2, 5, 4],
+         [5, 5, 1, 1, 5, 1],
+         [1, 1, 5, 2, 2, 1],
+         [3, 3, 5, 4, 5, 1]],
+        [15, 17, 20, 1],
+        [6, 14, 2, 29, 19, 3]),
+    #random 5x5 with many equal costs
+    "ties_2": (
+        [[2, 2, 1, 2, 4],
+         [3, 5, 2, 4, 5],
+         [5, 2, 2, 2, 4],
+         [5, 3, 2, 1, 2],
+         [1, 1, 4, 3, 5]],
+        [8, 12, 26, 18, 9],
+        [11, 23, 11, 15, 15]),
+    #random 5x5 with many equal costs, balanced
+    "ties_3": (
+        [[5, 2, 5, 1, 1],
+         [2, 2, 4, 1, 2],
+         [5, 5, 3, 5, 2],
+         [1, 5, 1, 2, 3],
+         [4, 1, 2, 1, 1]],
+        [6, 21, 16, 10, 20],
+        [10, 29, 8, 20, 6]),
+    #random 5x5 with many equal costs
+    "ties_4": (
+        [[5, 2, 1, 3, 4],
+         [2, 5, 3, 3, 3],
+         [3, 3, 3, 3, 5],
+         [5, 3, 1, 2, 2],
+         [4, 3, 1, 3, 1]],
+        [2, 1, 7, 28, 2],
+        [18, 1, 2, 10, 5]),
+    #random 5x3 with many equal costs, balanced
+    "ties_5": (
+        [[5, 3, 1],
+         [1, 4, 2],
+         [3, 4, 3],
+         [4, 1, 4],
+         [5, 3, 2]],
+        [9, 12, 23, 17, 6],
+        [8, 6, 53]),
+    #random 4x3 with many equal costs
+    "ties_6": (
+        [[4, 4, 2],
+         [1, 3, 2],
+         [2, 2, 1],
+         [1, 5, 3]],
+        [16, 6, 20, 22],
+        [28, 9, 1]),
+    #random 7x7 with many equal costs, balanced
+    "ties_7": (
+        [[3, 5, 1, 3, 4, 2, 2],
+         [3, 2, 3, 2, 3, 2, 3],
+         [4, 3, 3, 2, 1, 4, 5],
+         [4, 2, 3, 3, 3, 1, 5],
+         [2, 1, 4, 1, 2, 2, 5],
+         [4, 4, 3, 4, 5, 5, 4],
+         [3, 2, 1, 2, 4, 1, 4]],
+        [24, 24, 11, 4, 26, 7, 19],
+        [28, 28, 17, 12, 6, 22, 2]),
+    #random 4x4 with many equal costs
+    "ties_8": (
+        [[1, 1, 2, 3],
+         [2, 1, 2, 1],
+         [1, 2, 3, 2],
+         [1, 3, 5, 5]],
+        [26, 7, 25, 5],
+        [9, 4, 23, 3]),
+}
+
+#solve() keyword arguments checked for a method besides the default
+VARIANTS = {
+    "AssigningShortestMinimax": [{"revision": True}],
+}
+
+
+#runs whose expected result is not the one of the original implementation (commit 1b86498) on purpose,
+#as (class name, problem) with "*" for every problem, and the reason. They are recorded from the current implementation.
+OVERRIDES = {
+    #the original wrote c - (u + v) back into it's table, so delta drifted from the second iteration on
+    ("RussellsApproximationMethod", "*"): "delta is computed against the original costs",
+    #the original covering step keeps adding lines once every cover was used and never ends
+    ("ImprovedExponentialApproach", "ties_3"): "original does not finish",
+    ("ImprovedExponentialApproach", "ties_4"): "original does not finish",
+    #the covering step picks between the two Konig covers (row and column side) instead of scoring every cover of
+    #minimum_line lines, which is exponential in the table size
+    ("ImprovedExponentialApproach", "asm_unbalance"): "covering step uses the Konig covers only",
+    ("ImprovedExponentialApproach", "atoc_balance"): "covering step uses the Konig covers only",
+    ("ImprovedExponentialApproach", "example_unbalance"): "covering step uses the Konig covers only",
+    ("ImprovedExponentialApproach", "gm_unbalance"): "covering step uses the Konig covers only",
+    ("ImprovedExponentialApproach", "mdma_balance"): "covering step uses the Konig covers only",
+    ("ImprovedExponentialApproach", "ties_2"): "covering step uses the Konig covers only",
+    ("ImprovedExponentialApproach", "ties_5"): "covering step uses the Konig covers only",
+    ("ImprovedExponentialApproach", "ties_7"): "covering step uses the Konig covers only",
+}
+
+#solves runs with the original implementation, it takes labelled tables and returns (Ri, Cj, v) label lists
+ORIGINAL = r"""
+import sys, json, signal, importlib
+import numpy as np
+sys.path.insert(0, sys.argv[1])
+from transportation import Transportation
+
+def timeout(*args):
+    raise TimeoutError("original implementation didn't finish in {}s".format(sys.argv[3]))
+signal.signal(signal.SIGALRM, timeout)
+
+out = []
+for path, cost, supply, demand, kwargs in json.load(sys.stdin):
+    module, cls = path.split(":")
+    trans = Transportation(np.array(cost), np.array(supply), np.array(demand))
+    trans.setup_table(minimize=True)
+    rows, cols = list(trans.table[1:-1, 0]), list(trans.table[0, 1:-1])
+
+    signal.alarm(int(sys.argv[3]))
+    try:
+        alloc = getattr(importlib.import_module(module), cls)(trans).solve(**kwargs)
+    except Exception as e:
+        out.append(repr(e))
+        continue
+    finally:
+        signal.alarm(0)
+
+    #index of a label, Karagul-Sahin names the dummy after it's index instead of "Dummy"
+    index = lambda labels, label: labels.index(label) if label in labels else int(label[1:])
+    out.append([[index(rows, i), index(cols, j), v.item() if hasattr(v, "item") else v] for i, j, v in alloc])
+
+with open(sys.argv[2], "w") as f:
+    json.dump(out, f)
+"""
+
+
+def override(method, problem):
+    #reason the expected result of a run is not the original one, None if it is
+    name = class_name(method)
+    return OVERRIDES.get((name, problem), OVERRIDES.get((name, "*")))
+
+
+def solve_original(runs, baseline, timeout=20):
+    #allocations of runs by the original implementation in the baseline directory (a checkout of commit 1b86498),
+    #solved in another interpreter so it's modules don't clash with the current ones
+    #the original has every method as a top-level module instead of one of the initial_methods package
+    payload = [[registry.METHODS[lookup(method)].split(".")[-1], *PROBLEMS[problem], kwargs] for method, problem, kwargs in runs]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "original.json")
+        #the original methods print while solving
+        subprocess.run([sys.executable, "-c", ORIGINAL, os.path.abspath(baseline), path, str(timeout)],
+                       input=json.dumps(payload), text=True, stdout=subprocess.DEVNULL, check=True)
+        with open(path) as f:
+            results = json.load(f)
+
+    solved = []
+    for (method, problem, kwargs), cells in zip(runs, results):
+        if isinstance(cells, str):
+            raise RuntimeError("{} {} {}: {}, add it to OVERRIDES".format(class_name(method), problem, kwargs, cells))
+
+        #dummy cells cost nothing
+        cost = PROBLEMS[problem][0]
+        total = sum(v * cost[i][j] for i, j, v in cells if i < len(cost) and j < len(cost[0]))
+        solved.append((cells, total))
+    return solved
+
+
+def solve(method, problem, kwargs={}):
+    #allocation of method on problem, as (i, j, v) index lists in the order they were allocated
+    cost, supply, demand = PROBLEMS[problem]
+    trans = Transportation(np.array(cost), np.array(supply), np.array(demand))
+    trans.setup_table(minimize=True)
+
+    alloc = get(method)(trans).solve(**kwargs)
+    cells = [[int(i), int(j), v.item() if hasattr(v, "item") else v] for i, j, v in alloc.cells()]
+    return cells, alloc.total_cost().item()
+
+
+def runs(methods):
+    #every (method, problem, kwargs) of the corpus
+    for method in methods:
+        for kwargs in [{}] + VARIANTS.get(class_name(method), []):
+            for problem in PROBLEMS:
+                yield method, problem, kwargs
+
+
+def record(baseline, methods=METHODS, path=PATH):
+    """
+    Write expected allocations of methods, solved by the original implementation in the baseline directory
+    (e.g. git worktree add ../baseline 1b86498). Runs in OVERRIDES are solved by the current implementation
+    and keep their reason as "override". Expected runs of other methods in path are kept.
+    """
+
+    todo = list(runs(methods))
+    original = iter(solve_original([run for run in todo if override(run[0], run[1]) is None], baseline))
+
+    expected = []
+    for method, problem, kwargs in todo:
+        reason = override(method, problem)
+        cells, total = solve(method, problem, kwargs) if reason else next(original)
+
+        e = {
+            "method": class_name(method),
+            "problem": problem,
+            "kwargs": kwargs,
+            "total_cost": total,
+            "allocation": cells,
+        }
+        if reason:
+            e["override"] = reason
+        expected.append(e)
+
+    #keep the other methods, in registry order
+    names = {class_name(method) for method in methods}
+    if os.path.exists(path):
+        with open(path) as f:
+            expected += [e for e in json.load(f) if e["method"] not in names]
+    order = [class_name(method) for method in METHODS]
+    expected.sort(key=lambda e: order.index(e["method"]) if e["method"] in order else len(order))
+
+    #one run per line, so changes of expected results show up line by line in a diff
+    with open(path, "w") as f:
+        f.write("[\n" + ",\n".join(json.dumps(e) for e in expected) + "\n]\n")
+    return expected
+
+
+def check(methods=METHODS, path=PATH, ordered=True):
+    """
+    Compare methods against the expected allocations of the corpus.
+    methods can be any classes named like the expected ones (e.g. a new engine of VogelsApproximationMethod),
+    ordered=True also requires the allocations to be made in the same order, which is what proves
+    the same tie breaking. Return the list of mismatches.
+    """
+
+    with open(path) as f:
+        expected = {(e["method"], e["problem"], json.dumps(e["kwargs"], sort_keys=True)): e for e in json.load(f)}
+
+    mismatches = []
+    for method, problem, kwargs in runs(methods):
+        key = (class_name(method), problem, json.dumps(kwargs, sort_keys=True))
+        if key not in expected:
+            continue
+
+        e = expected[key]
+        try:
+            cells, total = solve(method, problem, kwargs)
+        except Exception as err:
+            mismatches.append(dict(e, got=repr(err)))
+            continue
+
+        want = e["allocation"] if ordered else sorted(e["allocation"])
+        got = cells if ordered else sorted(cells)
+        if got != want or total != e["total_cost"]:
+            mismatches.append(dict(e, got=cells, got_cost=total))
+
+    return mismatches
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="golden result regression check of the initial solution methods")
+    parser.add_argument("--update", action="store_true", help="record expected allocations from the original implementation of --baseline")
+    parser.add_argument("--baseline", help="checkout of the original implementation (commit 1b86498), needed by --update")
+    parser.add_argument("--unordered", action="store_true", help="compare allocated cells without their order")
+    parser.add_argument("--methods", nargs="+", help="registry names (vam, russell, ...) or class names, default all")
+    args = parser.parse_args()
+
+    methods = METHODS
+    if args.methods:
+        try:
+            methods = [lookup(name) for name in args.methods]
+        except KeyError as e:
+            sys.exit(e.args[0])
+
+    #python golden.py compares every method against golden.json,
+    #python golden.py --update --baseline ../baseline records it again from the original implementation,
+    #an intended change of results goes to OVERRIDES with it's reason first
+    if args.update:
+        if not args.baseline:
+            parser.error("--update needs --baseline, a checkout of the original implementation")
+        expected = record(args.baseline, methods)
+        print("recorded {} runs to {}".format(len(expected), PATH))
+        sys.exit(0)
+
+    mismatches = check(methods, ordered=not args.unordered)
+    for m in mismatches:
+        print("{method} {problem} {kwargs}".format(**m))
+        print("  expected {} {}".format(m["total_cost"], m["allocation"]))
+        print("  got      {} {}".format(m.get("got_cost"), m["got"]))
+
+    print("{} mismatches".format(len(mismatches)))
+    sys.exit(1 if mismatches else 0)
@@ -0,0 +1,71 @@
+import os
+import sys
+import argparse
+import subprocess
+
+#every module a worker or command line may import first
+MODULES = [
+    "transportation", "allocation", "allocation_engine", "line_cover", "initial_methods",
+    "assigning_shortest_minimax", "average_total_opprtunity_cost", "column_minima", "global_minium_method",
+    "harmonic_mean_approach", "heuristic_method_1", "heuristic_method_2", "improved_exponential_approach",
+    "karagul_sahin_approximation", "least_cost", "maximum_devide_minimum_allotment", "maximum_supply_minimum_cost",
+    "north_west_corner", "row_minima", "russels_approximation", "the_adavanced_method", "vogels_approximation",
+    "modified_distribution", "network_simplex", "batch_transportation", "registry", "portfolio", "cli", "service",
+]
+
+#modules that must only be loaded when something is displayed
+LAZY = ["pandas"]
+
+#seconds allowed to import a module in a fresh interpreter on top of numpy, numpy's own (cold) import time
+#varies too much between runs to be part of the budget
+BUDGET = 0.25
+
+#imported before the checked module in the same interpreter, so it's time is measured apart
+BASELINE = "numpy"
+
+
+def import_time(module):
+    #cumulative import time (seconds) of module once numpy is imported in a fresh interpreter,
+    #numpy's import time in the same run and the lazy modules module loaded
+    code = "import sys, {}, {}; print(' '.join(m for m in {!r} if m in sys.modules))".format(BASELINE, module, LAZY)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise ImportError("importing {} failed:\n{}".format(module, proc.stderr))
+
+    #lines of -X importtime are "import time: self [us] | cumulative | imported package"
+    seconds = {BASELINE: 0.0, module: 0.0}
+    for line in proc.stderr.splitlines():
+        name = line.rsplit("|", 1)[-1].strip()
+        if line.startswith("import time:") and name in seconds:
+            seconds[name] = int(line.split("|")[1]) / 1e6
+
+    return seconds[module], seconds[BASELINE], proc.stdout.split()
+
+
+def check(modules=MODULES, budget=BUDGET):
+    #list of (module, seconds, numpy seconds, lazy modules loaded) over budget or loading a lazy module
+    failed = []
+    for module in modules:
+        seconds, baseline, loaded = import_time(module)
+        if seconds > budget or loaded:
+            failed.append((module, seconds, baseline, loaded))
+    return failed
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="check import time of the modules and that pandas is loaded lazily")
+    parser.add_argument("--budget", type=float, default=BUDGET, help="seconds allowed per module on top of numpy's import time")
+    parser.add_argument("modules", nargs="*", default=MODULES)
+    args = parser.parse_args()
+
+    #python import_check.py checks every module, exit code is 1 if one is over budget or imports pandas
+    failed = check(args.modules, args.budget)
+    for module, seconds, baseline, loaded in failed:
+        print("{:35} {:.3f}s (+{:.3f}s {}) {}".format(module, seconds, baseline, BASELINE, " ".join(loaded)))
+
+    print("{} of {} modules over {}s budget on top of {} or loading {}".format(len(failed), len(args.modules), args.budget, BASELINE, ", ".join(LAZY)))
+    sys.exit(1 if failed else 0)
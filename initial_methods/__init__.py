@@ -0,0 +1,25 @@
+"""
+Initial basic feasible solution methods of the transportation problem, one module per method.
+The method classes are re-exported lazily, initial_methods.VogelsApproximationMethod imports vogels_approximation
+only, so selecting one method doesn't import the others (registry selects them by name the same way).
+The top-level modules of the same names (vogels_approximation.py, ...) are kept as shims of these modules.
+"""
+
+import importlib
+from registry import METHODS
+
+#module of every method class
+MODULES = {path.split(":")[1]: path.split(":")[0] for path in METHODS.values()}
+
+__all__ = list(MODULES)
+
+
+def __getattr__(name):
+    #method class imported on first access
+    if name in MODULES:
+        return getattr(importlib.import_module(MODULES[name]), name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,107 @@
+import numpy as np
+from transportation import Transportation, CHUNK
+from allocation_engine import AllocationEngine
+
+class ColumnMinima(AllocationEngine):
+    """
+    Column minima method Steps (Rule)
+    Step-1:	In this method, we allocate as much as possible in the lowest cost cell of the first Column, i.e. allocate min(si,dj).
+    Step-2:	
+    a. Subtract this min value from supply si and demand dj.
+    b. If the supply si is 0, then cross (strike) that row and If the demand dj is 0 then cross (strike) that column.
+    c. If min unit cost cell is not unique, then select the cell where maximum allocation can be possible
+    Step-3:	Repeact this process for all uncrossed (unstriked) rows and columns until all supply and demand values are 0.
+
+    Source: https://cbom.atozmath.com/example/CBOM/Transportation.aspx?he=e&q=cm
+    """
+
+    work_cost = False
+
+    def iter_allocations(self, show_iter=False):
+
+        #only the first uncrossed column gets allocations, columns before it are crossed
+        y, m = 0, len(self.demand)
+
+        #columns of a memory mapped cost are copied a block at a time, one column alone touches every page of the file
+        width = max(CHUNK // (len(self.supply) * self.cost.itemsize), 1) if self.trans.is_mapped else m
+        start, block = -width, None
+
+        while y < m and self.rows.any():
+
+            if y >= start + width:
+                start, block = y, np.array(self.cost[:, y:y + width], copy=self.trans.is_mapped)
+
+            #uncrossed rows having minimum cost in column y, select where maximum allocation can be possible
+            cost = np.where(self.rows, block[:, y - start], np.inf)
+            mins = np.flatnonzero(cost == cost.min())
+            x = mins[np.argmax(np.minimum(self.supply[mins], self.demand[y]))]
+
+            #allocated row x to column y or vice versa
+            yield self.allocate(x, y)
+
+            #move right when column y is crossed
+            if not self.cols[y]:
+                y += 1
+
+            #print table
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                    [16, 24, 16],
+                    [ 8, 16, 24]])
+    supply = np.array([76,  82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize column minima method with table that has been prepared before.
+    CM = ColumnMinima(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = CM.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+           C0    C1     C2      C3 Supply
+R0      19(5)    30     50   10(2)      7
+R1         70    30  40(7)   60(2)      9
+R2         40  8(8)     70  20(10)     18
+Demand      5     8      7      14     34
+
+TOTAL COST: 779
+
+example 2 unbalance problem
+           C0      C1      C2  Dummy Supply
+R0      4(72)    8(4)       8      0     76
+R1         16  24(21)  16(41)  0(20)     82
+R2          8  16(77)      24      0     77
+Demand     72     102      41     20    235
+
+TOTAL COST: 2712
+'''
@@ -0,0 +1,100 @@
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+
+class GlobalMinimum(AllocationEngine):
+    """
+    Global Minimum's Algorithm
+    1. For every cell (i, j) in the transportation tableau calculate a cost c'ij = min(si, dj) x cij.
+    2. Select the cell (i, j) with the minimum c'ij.
+    3. Set xij = min(si, dj).
+    4. Cross out row i or column j and reduce the supply or demand of the non-crossed-out row or column by the value of xij.
+    5. Repeat steps 2, 3, and 4 until there is no cell to allocate
+
+    Source: Y. Harrath dan J. Kaabi, "New Heuristic to generate an initial basic feasible solution for the balanced transportation problem", International Journal of Industrial and System Engineering vol. 30, no. 2, pp. 193-204, 2018.
+    """
+
+    def iter_allocations(self, show_iter=False):
+
+        #multiply cost with it's minimum supply / demand
+        self.cost *= np.minimum.outer(self.supply, self.demand)
+
+        if show_iter:
+            self.trans.print_frame(self.table)
+
+        #cells sorted once by weighted cost, equal costs stay in row-wise order
+        order = np.argsort(self.cost, axis=None, kind='stable')
+        row, col = np.divmod(order, self.cost.shape[1])
+
+        p = 0
+        while not self.is_solved():
+
+            #finding minimum cost, the first uncrossed cell
+            p = self.next_live(row, col, p)
+
+            #allocated row x to column y or vice versa
+            yield self.allocate(row[p], col[p])
+
+            #print table
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[15, 4, 6, 15],
+                    [5, 2, 15, 4],
+                    [6, 5, 3, 14]])
+    supply = np.array([70, 47, 33])
+    demand = np.array([52, 78, 15, 5])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 6,  1, 9, 3],
+                    [11,  5, 2, 8],
+                    [10, 12, 4, 7]])
+    supply = np.array([70, 55, 70])
+    demand = np.array([85, 35, 50, 45])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize global minimum method with table that has been prepared before.
+    GM = GlobalMinimum(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = GM.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+            C0     C1     C2    C3 Supply
+R0      15(52)  4(18)      6    15     70
+R1           5  2(42)     15  4(5)     47
+R2           6  5(18)  3(15)    14     33
+Demand      52     78     15     5    150
+
+TOTAL COST: 1091
+
+example 2 unbalance problem
+            C0     C1     C2     C3 Supply
+R0           6  1(35)      9  3(35)     70
+R1       11(5)      5  2(50)      8     55
+R2      10(60)     12      4  7(10)     70
+Dummy    0(20)      0      0      0     20
+Demand      85     35     50     45    195
+
+TOTAL COST: 965
+'''
@@ -0,0 +1,130 @@
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+
+class HeuristicMethod1(AllocationEngine):
+    """
+    Heuristic Method 1 Algorithm
+    Step 1: Calculate the difference between the two lowest costs cell (called Penalty) for each row and column. These are called as row and column penalties, P, respectively.
+    Step 2: Add the cost of cell for each row and column. These summations are called row and column cost, T, respectively.
+    Step 3: Compute the product of penalty P and the total cost T, that is PT for each row and column.
+    Step 4: Identify the row/column having lowest PT.
+    Step 5: Choose the cell having minimum cost in row/column identified in Step-4.
+    Step 6: Make maximum feasible allocation to the cell choosing in Step 5, if the cost of this cell is also minimum in it's row/column. Otherwise allocation is avoided and go to step-7.
+    Step 7: Identify the row/column having next to lowest PT.
+    Step 8: Choose the cell having minimum cost in row/column identified in Step 7.
+    Step 9: Make maximum feasible allocation to the cell choosen in Step 8.
+    Step 10: Cross out the satisfied row/column.
+    Step 11: Repeat the procedure until all the requirements are satisfied.
+
+    Source: http://cbom.atozmath.com/example/CBOM/Transportation.aspx?he=e&q=h1
+    """
+
+    def penalty(self, cost):
+        #gap of the two smallest costs of every row of cost, the cost itself if the row has only one,
+        #crossed cells are infinite so they never are one of the two
+        r = np.arange(cost.shape[0])
+        first = np.argmin(cost, 1)
+        low = cost[r, first]
+
+        #second smallest with the smallest taken out for a moment
+        cost[r, first] = np.inf
+        second = np.min(cost, 1)
+        cost[r, first] = low
+
+        return np.subtract(second, low, out=low.copy(), where=second < np.inf)
+    
+    def iter_allocations(self, show_iter=False):
+
+        while not self.is_solved():
+
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+            row_P = self.penalty(self.cost)
+            col_P = self.penalty(self.cost.T)
+
+            row_PT = row_P * np.sum(self.cost, 1, where=self.cols)
+            col_PT = col_P * np.sum(self.cost, 0, where=self.rows[:, None])
+            row_PT[~self.rows] = np.inf
+            col_PT[~self.cols] = np.inf
+
+            while True:
+                if min(row_PT) < min(col_PT):
+                    x = np.argmin(row_PT)
+                    y = np.argmin(self.cost[x])
+                    if min(self.cost[x]) == min(self.cost[:, y]):
+                        break
+                    else:
+                        row_PT[x] = np.inf
+                else:
+                    y = np.argmin(col_PT)
+                    x = np.argmin(self.cost[:, y])
+                    if min(self.cost[x]) == min(self.cost[:, y]):
+                        break
+                    else:
+                        col_PT[y] = np.inf
+
+            #crossed out lines are infinite in the working cost, so they never are a minimum again
+            x, y, v = self.allocate(x, y)
+            self.strike(x, y)
+            yield x, y, v
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                     [70, 30, 40, 60],
+                     [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                     [16, 24, 16],
+                     [ 8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize HM1 with table that has been prepared before.
+    HM1 = HeuristicMethod1(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = HM1.solve(show_iter=True)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+           C0    C1     C2     C3 Supply
+R0         19    30     50  10(7)      7
+R1      70(2)    30  40(7)     60      9
+R2      40(3)  8(8)     70  20(7)     18
+Demand      5     8      7     14     34
+
+TOTAL COST: 814
+
+example 2 unbalance problem
+           C0      C1      C2  Dummy Supply
+R0      4(56)       8       8  0(20)     76
+R1         16  24(41)  16(41)      0     82
+R2      8(16)  16(61)      24      0     77
+Demand     72     102      41     20    235
+
+TOTAL COST: 2968
+'''
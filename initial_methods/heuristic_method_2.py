@@ -0,0 +1,100 @@
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+
+class HeuristicMethod2(AllocationEngine):
+    """
+    Heuristic Method 2 Algorithm
+    Step 1: Determine the penalty i.e. the difference between the lowest and highest cost element of thet row/column.
+    Step 2: Identify the row/column having highest penalty and choose the variable having lowest cost in this selected row/column.
+    Step 3: Allocate as much as possible to this variable.
+    Step 4: Cross out the row or column which ever is statisfied and adjust the variable and required quantities.
+    Step 5: Compute the penalties and repeat procedure till all rows and columns are satisfied.
+
+    Source: http://cbom.atozmath.com/example/CBOM/Transportation.aspx?he=e&q=h2&ex=0
+    """
+
+    def penalty(self, cost, live, cols):
+        #gap of the largest and smallest cost over the uncrossed cols of every uncrossed row (live) of cost
+        gaps = np.max(cost, 1, where=cols, initial=-np.inf) - np.min(cost, 1, where=cols, initial=np.inf)
+        gaps[~live] = -np.inf
+        return gaps
+    
+    def iter_allocations(self, show_iter=False):
+
+        while not self.is_solved():
+
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+            #penalties on the whole table with crossed rows and columns masked out
+            row_P = self.penalty(self.cost, self.rows, self.cols)
+            col_P = self.penalty(self.cost.T, self.cols, self.rows)
+
+            if max(row_P) > max(col_P):
+                x = np.argmax(row_P)
+                y = self.row_min(x)
+            else:
+                y = np.argmax(col_P)
+                x = self.col_min(y)
+
+            yield self.allocate(x, y)
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                     [70, 30, 40, 60],
+                     [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                     [16, 24, 16],
+                     [ 8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize HM1 with table that has been prepared before.
+    HM2 = HeuristicMethod2(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = HM2.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+           C0    C1     C2      C3 Supply
+R0      19(5)    30     50   10(2)      7
+R1         70    30  40(7)   60(2)      9
+R2         40  8(8)     70  20(10)     18
+Demand      5     8      7      14     34
+
+TOTAL COST: 779
+
+example 2 unbalance problem
+           C0      C1      C2  Dummy Supply
+R0          4   8(76)       8      0     76
+R1         16  24(21)  16(41)  0(20)     82
+R2      8(72)   16(5)      24      0     77
+Demand     72     102      41     20    235
+
+TOTAL COST: 2424
+'''
@@ -0,0 +1,136 @@
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+from allocation import Allocation
+
+class KaragulSahinApproximation(AllocationEngine):
+    """
+    Karagul-Sahin's Algorithm
+    1. Calculate the rij (pdm) and rji (psm) values for matrix A (wcd) and B (wcs)
+    2. Calculate the weighted transportation cost matrix by multiplying the rates and the cost values and form A (wcd) and B (wcs) matrices.
+    3. To start with the smallest weighted costs in the matrices wcd and wcs, make assignments taking into account the demand and supply constraints.
+    4. If all demand are met, finish the algorithm. Otherwise, go back to Step 3.
+    5. Compare the solution values of assignments matrices. Set the smaller solution as the initial solution.
+
+    Source: K. Karagul and Y. Sahin, "A novel approximation method to obtain initial basic feasible solution of transportation problem", J. King Saud Univ. 2019.
+    """
+
+    def iter_part(self, show_iter=False):
+
+        #weights come from the starting supply and demand, so cells are sorted once by weighted cost,
+        #equal costs stay in row-wise order
+        order = np.argsort(self.cost, axis=None, kind='stable')
+        row, col = np.divmod(order, self.cost.shape[1])
+
+        p = 0
+        while not self.is_solved():
+
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+            #finding minimum cost, the first uncrossed cell
+            p = self.next_live(row, col, p)
+
+            #allocated row x to column y or vice versa
+            yield self.allocate(row[p], col[p])
+
+    def find_cost(self, alloc):
+
+        #finding total cost given (i, j, v)
+        return Allocation.from_cells(self.trans, alloc).total_cost()
+
+    def iter_allocations(self, show_iter=False):
+
+        #the better of WCD and WCS is only known after both are solved,
+        #so allocations are yielded once the two solutions are compared
+        cost, supply, demand = self.cost, self.supply, self.demand
+
+        #compute Rij and Rji
+        Rij = demand[None, :] / supply[:, None]
+        Rji = supply[:, None] / demand[None, :]
+
+        #solve for WCD and WCS
+        min_cost = np.inf
+        for R, title in zip([Rij, Rji], ["WCD", "WCS"]):
+
+            if show_iter:
+                print("{} SOLUSTION\n".format(title))
+
+            #solve the same problem with cost multiplied by Rij/Rji (WCD/WCS),
+            #each pass starts again from the whole table
+            self.cost = cost * R
+            self.supply, self.demand = supply.copy(), demand.copy()
+            self.rows[:], self.cols[:] = True, True
+
+            alloc = list(self.iter_part(show_iter=show_iter))
+            total_cost = self.find_cost(alloc)
+
+            if show_iter:
+                print("{} TOTAL COST = {}\n".format(title, total_cost))
+
+            #save allocation if it has minimum cost
+            if total_cost < min_cost:
+                min_cost = total_cost
+                best = alloc
+
+        self.cost = cost
+        yield from best
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[6,  8, 10],
+                    [7, 11, 11],
+                    [7,  5, 12]])
+    supply = np.array([150, 175, 275])
+    demand = np.array([200, 100, 300])
+
+    #example 2 unbalance problem
+    cost = np.array([[390, 380, 500],
+                    [290, 280, 400],
+                    [240, 230, 350]])
+    supply = np.array([30000, 40000, 60000])
+    demand = np.array([20000, 30000, 30000])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize Karagul-Sahin method with table that has been prepared before.
+    KS = KaragulSahinApproximation(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = KS.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+            C0      C1       C2 Supply
+R0       6(25)       8  10(125)    150
+R1           7      11  11(175)    175
+R2      7(175)  5(100)       12    275
+Demand     200     100      300    600
+
+TOTAL COST: 5050
+
+example 2 unbalance problem
+                C0          C1          C2     Dummy  Supply
+R0             390         380         500  0(30000)   30000
+R1             290         280  400(20000)  0(20000)   40000
+R2      240(20000)  230(30000)  350(10000)         0   60000
+Demand       20000       30000       30000     50000  130000
+
+TOTAL COST: 23200000
+'''
@@ -0,0 +1,176 @@
+import numpy as np
+from transportation import Transportation, row_chunks, CHUNK
+from allocation_engine import AllocationEngine
+
+class LeastCost(AllocationEngine):
+    """
+    Least Cost Method (LCM) Steps (Rule)
+    Step-1:	Select the cell having minimum unit cost cij and allocate as much as possible, i.e. min(si,dj).
+    Step-2:
+        a. Subtract this min value from supply si and demand dj.
+        b. If the supply si is 0, then cross (strike) that row and If the demand dj is 0 then cross (strike) that column.
+        c. If min unit cost cell is not unique, then select the cell where maximum allocation can be possible
+    Step-3:	Repeact this steps for all uncrossed (unstriked) rows and columns until all supply and demand values are 0.
+
+    Source: https://cbom.atozmath.com/example/CBOM/Transportation.aspx?he=e&q=lcm
+    """
+
+    sparse = True
+    work_cost = False
+
+    def iter_allocations(self, show_iter=False):
+
+        #a memory mapped cost is scanned by rows instead of being sorted as a whole
+        if self.trans.is_mapped:
+            yield from self.iter_rows(show_iter)
+            return
+
+        #cells (allowed lanes of a sparse problem) sorted once by cost, equal costs stay in row-wise order
+        row, col, cost = self.trans.arcs()
+        order = np.argsort(cost, kind='stable')
+        row, col, cost = row[order], col[order], cost[order]
+
+        p = 0
+        while not self.is_solved():
+
+            #skip crossed cells, the first uncrossed one has minimum cost
+            p = self.next_live(row, col, p)
+            if p == len(row):
+                yield self.allocate(*self.artificial())
+                continue
+
+            #uncrossed cells having minimum cost, pick where maximum allocation can be possible
+            q = np.searchsorted(cost, cost[p], side='right')
+            i, j = row[p:q], col[p:q]
+            alloc = np.minimum(self.supply[i], self.demand[j])
+            alloc = np.where(self.rows[i] & self.cols[j], alloc, -1)
+            k = np.argmax(alloc)
+
+            #allocated row x to column y or vice versa
+            yield self.allocate(i[k], j[k])
+
+            #print table
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+    def iter_rows(self, show_iter=False):
+        #same allocations without sorting the cost, low[i] is the minimum cost of row i (at column arg[i]),
+        #a lower bound once a column is crossed, read again from the cost when it's the minimum of all rows
+        n = len(self.supply)
+        low = np.empty(n)
+        arg = np.empty(n, dtype=np.intp)
+        for chunk in row_chunks(self.cost):
+            block = np.asarray(self.cost[chunk])
+            arg[chunk] = block.argmin(axis=1)
+            low[chunk] = block[np.arange(len(block)), arg[chunk]]
+        exact = np.ones(n, dtype=bool)
+
+        #rows of the cost read at once
+        step = max(CHUNK // (len(self.demand) * 8), 1)
+
+        while not self.is_solved():
+
+            #minimum cost, rows that may have it are read again until the minimum is exact
+            while True:
+                c = low.min()
+                if c == np.inf:
+                    break
+                stale = np.flatnonzero((low == c) & ~exact)
+                if not len(stale):
+                    break
+                for a in range(0, len(stale), step):
+                    rows = stale[a:a + step]
+                    lines = np.where(self.cols, self.cost[rows], np.inf)
+                    arg[rows] = lines.argmin(axis=1)
+                    low[rows] = lines[np.arange(len(rows)), arg[rows]]
+                exact[stale] = True
+
+            if c == np.inf:
+                #every uncrossed cell costs inf, same last resort as a sparse problem
+                yield self.allocate(*self.artificial())
+                continue
+
+            #uncrossed cells having minimum cost in row-wise order
+            i, j = [], []
+            for rows in np.array_split(np.flatnonzero(low == c), range(step, n, step)):
+                r, col = np.nonzero(np.where(self.cols, self.cost[rows], np.inf) == c)
+                i.append(rows[r])
+                j.append(col)
+            i, j = np.concatenate(i), np.concatenate(j)
+
+            while True:
+
+                #pick where maximum allocation can be possible until every cell of minimum cost is crossed
+                alloc = np.where(self.rows[i] & self.cols[j], np.minimum(self.supply[i], self.demand[j]), -1)
+                k = np.argmax(alloc)
+                if alloc[k] < 0:
+                    break
+
+                #allocated row x to column y or vice versa
+                yield self.allocate(i[k], j[k])
+
+                #print table
+                if show_iter:
+                    self.trans.print_frame(self.table)
+
+            #crossed rows are out, rows having their minimum in a crossed column are read again when needed
+            low[~self.rows] = np.inf
+            exact &= self.cols[arg]
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                    [16, 24, 16],
+                    [8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize least cost method with table that has been prepared before.
+    least_cost = LeastCost(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = least_cost.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+           C0    C1     C2     C3 Supply
+R0         19    30     50  10(7)      7
+R1      70(2)    30  40(7)     60      9
+R2      40(3)  8(8)     70  20(7)     18
+Demand      5     8      7     14     34
+
+TOTAL COST: 814
+
+example 2 unbalance problem
+           C0      C1      C2  Dummy Supply
+R0      4(56)       8       8  0(20)     76
+R1         16  24(41)  16(41)      0     82
+R2      8(16)  16(61)      24      0     77
+Demand     72     102      41     20    235
+
+TOTAL COST: 2968
+'''
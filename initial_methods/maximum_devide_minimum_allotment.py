@@ -0,0 +1,101 @@
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+
+class MaximumDevideMinimumAllotment(AllocationEngine):
+    """
+    MDMA Algorithm
+    Step 1: Construct the Transportation Table (TT) for the given Pay Off Matrix (POM).
+    Step 2: Choose the maximum element(ME) from POM and divide all elements by the ME in the Constructed Transportation Table (CTT).
+    Step 3: Supply the demand for the minimum element newly CTT.
+    Step 4: Select the next maximum element in CTT and repeat the same procedure for remaining allotments
+
+    Source: A. Amaravathy, K. Thiagarajan and S. Vimala, "MDMA Method- An Optimal Solution for Transportation Problem", Middle-East Journal of Scientific Research 24 (12): 3706-3710, 2016.
+    """
+
+    def iter_allocations(self, show_iter=False):
+
+        while not self.is_solved():
+
+            #minimum and maximum of the uncrossed cells through the ones of every column
+            live = self.rows.reshape(-1, 1)
+            low = np.min(self.cost, 0, where=live, initial=np.inf)[self.cols].min()
+            high = np.max(self.cost, 0, where=live, initial=-np.inf)[self.cols].max()
+
+            #first uncrossed cell of the minimum in row major order
+            hit = self.cost == low
+            hit &= live
+            hit &= self.cols
+            x, y = np.unravel_index(np.argmax(hit), hit.shape)
+
+            #divide by the maximum of the uncrossed cells, it stays 1 until the cells of it are crossed out
+            if high != 1:
+                self.cost /= high
+
+            #allocated row x to column y or vice versa
+            yield self.allocate(x, y)
+
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[12,  4, 9, 5, 9],
+                    [ 8,  1, 6, 6, 7],
+                    [ 1, 12, 4, 7, 7],
+                    [10, 15, 6, 9, 1]])
+
+    supply = np.array([55, 45, 30, 50])
+    demand = np.array([40, 20, 50, 30, 40])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                    [16, 24, 16],
+                    [8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize MDMA method with table that has been prepared before.
+    MDMA = MaximumDevideMinimumAllotment(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = MDMA.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+            C0     C1     C2     C3     C4 Supply
+R0      12(10)      4  9(15)  5(30)      9     55
+R1           8  1(20)  6(25)      6      7     45
+R2       1(30)     12      4      7      7     30
+R3          10     15  6(10)      9  1(40)     50
+Demand      40     20     50     30     40    180
+
+TOTAL COST: 705
+
+example 2 unbalance problem
+           C0      C1      C2  Dummy Supply
+R0      4(56)       8       8  0(20)     76
+R1         16  24(41)  16(41)      0     82
+R2      8(16)  16(61)      24      0     77
+Demand     72     102      41     20    235
+
+TOTAL COST: 2968
+'''
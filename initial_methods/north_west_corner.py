@@ -0,0 +1,99 @@
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+
+class NorthWestCorner(AllocationEngine):
+    """
+    North-West Corner Method (NWCM) Steps (Rule)
+    Step-1:	Select the upper left corner cell of the transportation matrix and allocate min(s1, d1).
+    Step-2:
+        a. Subtract this value from supply and demand of respective row and column.
+        b. If the supply is 0, then cross (strike) that row and move down to the next cell.
+        c. If the demand is 0, then cross (strike) that column and move right to the next cell.
+        d. If supply and demand both are 0, then cross (strike) both row & column and move diagonally to the next cell.
+    Step-3:	Repeact this steps until all supply and demand values are 0.
+
+    Source: https://cbom.atozmath.com/example/CBOM/Transportation.aspx?he=e&q=nwcm&ex=0
+    """
+
+    work_cost = False
+
+    def iter_allocations(self, show_iter=False):
+
+        #north west corner cell only moves down or right, crossed rows and columns are all before it
+        x, y = 0, 0
+        n, m = len(self.supply), len(self.demand)
+
+        while x < n and y < m:
+
+            #allocated row x to column y or vice versa
+            yield self.allocate(x, y)
+
+            #move down and/or right past the crossed row and column
+            if not self.rows[x]:
+                x += 1
+            if not self.cols[y]:
+                y += 1
+
+            #print table
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40, 8,  70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[4,   8,  8],
+                    [16, 24, 16],
+                    [ 8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize NWC method with table that has been prepared before.
+    NWC = NorthWestCorner(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = NWC.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+           C0     C1     C2      C3 Supply
+R0      19(5)  30(2)     50      10      7
+R1         70  30(6)  40(3)      60      9
+R2         40      8  70(4)  20(14)     18
+Demand      5      8      7      14     34
+
+TOTAL COST: 1015
+
+example 2 unbalance problem
+           C0      C1      C2  Dummy Supply
+R0      4(72)    8(4)       8      0     76
+R1         16  24(82)      16      0     82
+R2          8  16(16)  24(41)  0(20)     77
+Demand     72     102      41     20    235
+
+TOTAL COST: 3528
+'''
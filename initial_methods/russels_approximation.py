@@ -0,0 +1,187 @@
+import heapq
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+
+class RussellsApproximationMethod(AllocationEngine):
+    """
+    Russell's Approximation Method (RAM):
+    Step-1:	For each source row still under consideration, determine its Ui (largest cost in row i).
+    Step-2:	For each destination column still under consideration, determine its Vj (largest cost in column j).
+    Step-3:	For each variable, calculate Δij=cij-(Ui +  Vj).
+    Step-4:	Select the variable having the most negative Δ value, break ties arbitrarily.
+    Step-5:	Allocate as much as possible. Eliminate necessary cells from consideration. Return to Step-1.
+
+    Source: https://cbom.atozmath.com/example/CBOM/Transportation.aspx?he=e&q=ram
+    """
+
+    sparse = True
+
+    def iter_arcs(self, show_iter=False):
+
+        #allowed lanes, delta is computed against their original cost
+        row, col, cost = self.trans.arcs()
+        cost = np.array(cost, dtype=float)
+
+        while not self.is_solved():
+            arcs = np.flatnonzero(self.rows[row] & self.cols[col])
+            if len(arcs) == 0:
+                yield self.allocate(*self.artificial())
+                continue
+
+            i, j = row[arcs], col[arcs]
+
+            #compute U and V over uncrossed lanes
+            U = np.full(len(self.supply), -np.inf)
+            V = np.full(len(self.demand), -np.inf)
+            np.maximum.at(U, i, cost[arcs])
+            np.maximum.at(V, j, cost[arcs])
+
+            #find the most negative delta
+            k = np.argmin(cost[arcs] - V[j] - U[i])
+
+            #allocated row x to column y or vice versa
+            yield self.allocate(i[k], j[k])
+
+            #print table
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+    def row_best(self, rows):
+        #minimum cij - Vj over uncrossed columns of each row, it's column and delta (minus Ui)
+        cols = np.flatnonzero(self.cols)
+        W = self.cost[np.ix_(rows, cols)] - self.V[cols]
+        k = np.argmin(W, 1)
+        self.best[rows] = cols[k]
+        return W[np.arange(len(rows)), k] - self.U[rows]
+
+    def push(self, rows):
+        #push rows with their new best delta, older entries of those rows become invalid
+        self.version[rows] += 1
+        for i, d in zip(rows.tolist(), self.row_best(rows).tolist()):
+            heapq.heappush(self.heap, (d, i, self.version[i]))
+
+    def update(self, x, y):
+        #U and V only decrease when lines are crossed out, so deltas only increase.
+        #recompute maxima whose line was crossed out, then rows whose U or best column changed
+        rows, cols = self.live()
+        changed_rows = np.zeros(len(self.supply), dtype=bool)
+
+        if not self.cols[y]:
+            hit = rows[self.U_at[rows] == y]
+            if len(hit):
+                cost = self.cost[np.ix_(hit, cols)]
+                self.U[hit] = cost.max(1)
+                self.U_at[hit] = cols[np.argmax(cost, 1)]
+            changed_rows[hit] = True
+            changed_rows[rows[self.best[rows] == y]] = True
+
+        if not self.rows[x]:
+            hit = cols[self.V_at[cols] == x]
+            if len(hit):
+                cost = self.cost[np.ix_(rows, hit)]
+                self.V[hit] = cost.max(0)
+                self.V_at[hit] = rows[np.argmax(cost, 0)]
+            changed_rows[rows[np.isin(self.best[rows], hit)]] = True
+
+        changed_rows &= self.rows
+        self.push(np.flatnonzero(changed_rows))
+
+    def select(self):
+        #most negative delta, ties are broken by row then column index
+        while True:
+            d, i, version = heapq.heappop(self.heap)
+            if self.rows[i] and version == self.version[i]:
+                return i, self.best[i]
+
+    def iter_allocations(self, show_iter=False):
+
+        if self.trans.is_sparse:
+            yield from self.iter_arcs(show_iter=show_iter)
+            return
+
+        #compute U and V with the line of their maximum
+        self.U, self.U_at = self.cost.max(1), np.argmax(self.cost, 1)
+        self.V, self.V_at = self.cost.max(0), np.argmax(self.cost, 0)
+
+        #heap of (delta, row, version) holding the best delta of every row
+        self.best = np.zeros(len(self.supply), dtype=int)
+        self.version = np.zeros(len(self.supply), dtype=int)
+        self.heap = []
+        self.push(np.arange(len(self.supply)))
+
+        while not self.is_solved():
+
+            #find the most negative
+            x, y = self.select()
+
+            #allocated row x to column y or vice versa
+            alloc = self.allocate(x, y)
+
+            if not self.is_solved():
+                self.update(x, y)
+
+            yield alloc
+
+            #print table
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                    [16, 24, 16],
+                    [ 8, 16, 24]])
+    supply = np.array([76,  82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize Russell's Approximation method with table that has been prepared before.
+    RAM = RussellsApproximationMethod(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = RAM.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+           C0     C1     C2      C3 Supply
+R0      19(5)  30(2)     50      10      7
+R1         70  30(2)  40(7)      60      9
+R2         40   8(4)     70  20(14)     18
+Demand      5      8      7      14     34
+
+TOTAL COST: 807
+
+example 2 unbalance problem
+            C0      C1      C2  Dummy Supply
+R0           4   8(76)       8      0     76
+R1      16(41)      24  16(41)      0     82
+R2       8(31)  16(26)      24  0(20)     77
+Demand      72     102      41     20    235
+
+TOTAL COST: 2584
+'''
@@ -0,0 +1,124 @@
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+
+class TheAdvanceMethod(AllocationEngine):
+    """
+    The Advance Method Algorithm
+    Step 1: Select row/column index having minimum value in supply and demand as i (if it's row) or j (if it's column).
+    Step 2: Select index of minimum cost in row/column has minimum supply.or demand as i (if it's row) or j (if it's column)
+    Step 3: Let value = Xij.
+    Step 4:
+        a. Subtract this value from supply si and demand dj.
+        b. If the supply si is 0, then cross (strike) that row and If the demand dj is 0 then cross (strike) that column.
+        c. If min unit cost cell is not unique, then select the cell where supply/demand has minimum value.
+    Step-5:	Repeact this steps for all uncrossed (unstriked) rows and columns until all supply and demand values are 0.
+    """
+
+    def iter_allocations(self, show_iter=False):
+
+        cost = self.cost.copy()
+        cost = np.where(cost % 2 == 1, cost, np.inf)
+        mins = np.min(cost)
+
+        cost = self.cost.copy()
+        cost = np.where(cost % 2 == 1, cost - mins, cost)
+            
+        self.cost = cost.copy()
+
+        if show_iter:
+            self.trans.print_frame(self.table)
+
+        x, y = np.argwhere(self.cost == 0)[0]
+        yield self.allocate(x, y)
+
+        while not self.is_solved():
+
+            #rim values of crossed rows and columns are never the minimum
+            supply = np.where(self.rows, self.supply, np.inf)
+            demand = np.where(self.cols, self.demand, np.inf)
+
+            if supply.min() < demand.min():
+                #minimum cost of the uncrossed cells of row x, ties go to the column of minimum demand
+                x = np.argmin(supply)
+                cost = np.where(self.cols, self.cost[x], np.inf)
+                i = np.flatnonzero(cost == cost.min())
+                y = i[np.argmin(demand[i])]
+
+            else:
+                y = np.argmin(demand)
+                cost = np.where(self.rows, self.cost[:, y], np.inf)
+                i = np.flatnonzero(cost == cost.min())
+                x = i[np.argmin(supply[i])]
+
+            yield self.allocate(x, y)
+
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[489, 350, 142, 365, 424, 272, 272],
+                    [272, 410, 350, 489, 365, 489, 253],
+                    [424, 489, 365, 253, 410, 410, 142],
+                    [365, 257, 472, 272, 350, 410, 142],
+                    [350, 272, 365, 472, 410, 257, 272],])
+    supply = np.array([2314, 2628, 2493, 2268, 2398])
+    demand = np.array([1900, 1778, 1694, 1851, 1959, 1838, 1081])
+
+    #example 2 unbalance problem
+    cost = np.array([[60, 120, 75, 180],
+                    [58, 100, 60, 165],
+                    [62, 110, 65, 170],
+                    [65, 115, 80, 175],
+                    [70, 135, 85, 195],])
+    supply = np.array([8000, 9200, 6250, 4900, 6100])
+    demand = np.array([5000, 2000, 10000, 6000])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize TAM method with table that has been prepared before.
+    TAM = TheAdvanceMethod(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = TAM.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+               C0         C1         C2         C3         C4         C5         C6 Supply
+R0            489        350        142  365(1180)        424  272(1134)        272   2314
+R1            272        410        350        489  365(1547)        489  253(1081)   2628
+R2      424(1822)        489        365   253(671)        410        410        142   2493
+R3        365(78)  257(1778)        472        272   350(412)        410        142   2268
+R4            350        272  365(1694)        472        410   257(704)        272   2398
+Demand       1900       1778       1694       1851       1959       1838       1081  12101
+
+TOTAL COST: 3948441
+
+example 2 unbalance problem
+              C0         C1        C2         C3    Dummy Supply
+R0            60        120        75        180  0(8000)   8000
+R1      58(5000)        100  60(4200)        165        0   9200
+R2            62        110   65(250)  170(6000)        0   6250
+R3            65  115(2000)        80        175  0(2900)   4900
+R4            70        135  85(5550)        195   0(550)   6100
+Demand      5000       2000     10000       6000    11450  34450
+
+TOTAL COST: 2280000
+'''
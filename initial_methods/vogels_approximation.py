@@ -0,0 +1,228 @@
+import heapq
+import numpy as np
+from transportation import Transportation
+from allocation_engine import AllocationEngine
+
+class VogelsApproximationMethod(AllocationEngine):
+    """
+    Vogel's Approximation Method (VAM) or penalty method
+    This method is preferred over the NWCM and VAM, because the initial basic feasible solution obtained by this method is either optimal solution or very nearer to the optimal solution.
+    Vogel's Approximation Method (VAM) Steps (Rule)
+    Step-1:	Find the cells having smallest and next to smallest cost in each row and write the difference (called penalty) along the side of the table in row penalty.
+    Step-2:	Find the cells having smallest and next to smallest cost in each column and write the difference (called penalty) along the side of the table in each column penalty.
+    Step-3:	Select the row or column with the maximum penalty and find cell that has least cost in selected row or column. Allocate as much as possible in this cell.
+    If there is a tie in the values of penalties then select the cell where maximum allocation can be possible
+    Step-4:	Adjust the supply & demand and cross out (strike out) the satisfied row or column.
+    Step-5:	Repeact this steps until all supply and demand values are 0.
+
+    Source: https://cbom.atozmath.com/example/CBOM/Transportation.aspx?he=e&q=vam
+    """
+
+    sparse = True
+
+    def __init__(self, trans, on_iteration=None):
+        super().__init__(trans, on_iteration=on_iteration)
+
+        #allowed lanes (arcs), every cell of a dense problem
+        row, col, cost = trans.arcs()
+        self.arc_cost = np.array(cost, dtype=float)
+        self.arc_line = [row, col]
+
+        #arcs of each row (k=0) and each column (k=1) sorted by cost, rows start at start[0][i] and columns at start[1][j].
+        #stable sort keep equal costs in index order, same as np.where in the tie breaking.
+        self.order = [np.lexsort((cost, row)), np.lexsort((cost, col))]
+        self.start = [
+            np.append(0, np.cumsum(np.bincount(row, minlength=len(self.supply)))),
+            np.append(0, np.cumsum(np.bincount(col, minlength=len(self.demand)))),
+        ]
+
+        #position of the lowest and next to lowest uncrossed cost in each row/column order
+        self.first = [self.start[0][:-1].copy(), self.start[1][:-1].copy()]
+        self.second = [self.first[0] + 1, self.first[1] + 1]
+
+        #uncrossed rows/columns and the uncrossed lines crossing them
+        self.alive = [self.rows, self.cols]
+        self.crossing = [self.cols, self.rows]
+
+        #max-heap of (-penalty, k, index, version), outdated entries are skipped lazily
+        self.version = [np.zeros(len(self.supply), dtype=int), np.zeros(len(self.demand), dtype=int)]
+        self.heap = []
+
+    def penalty(self, k, i):
+        #return gap between two lowest uncrossed cost in row/column i,
+        #-1 if no allowed lane of line i is left, such lines come after every other line
+        order, line, alive = self.order[k], self.arc_line[1 - k], self.crossing[k]
+        end = self.start[k][i + 1]
+
+        p = self.first[k][i]
+        while p < end and not alive[line[order[p]]]:
+            p += 1
+
+        if p == end:
+            self.first[k][i], self.second[k][i] = end, end
+            return -1
+
+        #cost between first and second pointer were crossed already
+        q = max(self.second[k][i], p + 1)
+        while q < end and not alive[line[order[q]]]:
+            q += 1
+
+        self.first[k][i], self.second[k][i] = p, q
+
+        x = self.arc_cost[order[p]]
+        y = self.arc_cost[order[q]] if q < end else 0
+        return abs(x - y)
+
+    def push(self, k, i):
+        self.version[k][i] += 1
+        heapq.heappush(self.heap, (-float(self.penalty(k, i)), k, i, self.version[k][i]))
+
+    def is_valid(self, entry):
+        _, k, i, version = entry
+        return self.alive[k][i] and self.version[k][i] == version
+
+    def touched(self, k, i):
+        #uncrossed lines crossing line i whose two lowest cost include line i
+        lines = np.flatnonzero(self.crossing[k])
+        order, line = self.order[1 - k], self.arc_line[k]
+
+        first, second = self.first[1 - k][lines], self.second[1 - k][lines]
+        has_first = first < self.start[1 - k][lines + 1]
+        has_second = second < self.start[1 - k][lines + 1]
+        first = line[order[np.minimum(first, len(order) - 1)]]
+        second = line[order[np.minimum(second, len(order) - 1)]]
+
+        return lines[(has_first & (first == i)) | (has_second & (second == i))]
+
+    def select(self):
+        heap = self.heap
+
+        #drop crossed out lines and outdated penalties
+        while not self.is_valid(heap[0]):
+            heapq.heappop(heap)
+
+        #pop every line having maximum penalty,
+        #they come out rows first then columns, each in index order
+        top = heap[0][0]
+        if top > 0:
+            #no allowed lane is left between uncrossed rows and columns
+            return self.artificial()
+
+        tied = []
+        while heap and heap[0][0] == top:
+            entry = heapq.heappop(heap)
+            if self.is_valid(entry):
+                tied.append(entry)
+
+        for entry in tied:
+            heapq.heappush(heap, entry)
+
+        max_alloc = -np.inf
+        for _, k, i, _ in tied:
+            order, line, alive = self.order[k], self.arc_line[1 - k], self.crossing[k]
+            end = self.start[k][i + 1]
+
+            #check if minimum cost has a tie
+            #in maximum row/columns penalties
+            p = self.first[k][i]
+            mins = self.arc_cost[order[p]]
+            while p < end and self.arc_cost[order[p]] == mins:
+                j = line[order[p]]
+                p += 1
+                if not alive[j]:
+                    continue
+
+                r, c = (i, j) if k == 0 else (j, i)
+                alloc = min([self.supply[r], self.demand[c]])
+                if alloc > max_alloc:
+                    max_alloc = alloc
+                    x, y = r, c
+
+        return x, y
+
+    def iter_allocations(self, show_iter=False):
+
+        #compute row and column penalties
+        for k, alive in enumerate(self.alive):
+            for i in np.flatnonzero(alive):
+                self.push(k, i)
+
+        while not self.is_solved():
+
+            x, y = self.select()
+
+            #allocated row x to column y or vice versa
+            alloc = self.allocate(x, y)
+
+            #only update penalties of lines which lost one of their two lowest cost
+            if not self.is_solved():
+                if not self.rows[x]:
+                    for j in self.touched(0, x):
+                        self.push(1, j)
+                if not self.cols[y]:
+                    for i in self.touched(1, y):
+                        self.push(0, i)
+
+            yield alloc
+
+            #print table
+            if show_iter:
+                self.trans.print_frame(self.table)
+
+if __name__ == "__main__":
+    
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                    [16, 24, 16],
+                    [ 8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize Vogel's method with table that has been prepared before.
+    VAM = VogelsApproximationMethod(trans)
+
+    #solve problem and return allocation lists which consist n of (Ri, Cj, v)
+    #Ri and Cj is table index where cost is allocated and v it's allocated value.
+    #(R0, C1, 3) means 3 cost is allocated at Row 0 and Column 1.
+    #show_iter=True will showing table changes per iteration, default=False.
+    allocation = VAM.solve(show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+
+#Result from example problem above
+'''
+example 1 balance problem
+           C0    C1     C2      C3 Supply
+R0      19(5)    30     50   10(2)      7
+R1         70    30  40(7)   60(2)      9
+R2         40  8(8)     70  20(10)     18
+Demand      5     8      7      14     34
+
+TOTAL COST: 779
+
+example 2 unbalance problem
+           C0      C1      C2  Dummy Supply
+R0          4   8(76)       8      0     76
+R1         16  24(21)  16(41)  0(20)     82
+R2      8(72)   16(5)      24      0     77
+Demand     72     102      41     20    235
+
+TOTAL COST: 2424
+'''
@@ -0,0 +1,97 @@
+import numpy as np
+
+def maximum_matching(indptr, indices, m):
+    """
+    Hopcroft-Karp maximum matching of a bipartite graph of n rows and m columns
+    Row i is adjacent to columns indices[indptr[i]:indptr[i + 1]].
+    Step-1:	Breadth first search from the unmatched rows along alternating paths (any edge to a column, matched edge back to a row) to layer the rows.
+    Step-2:	Depth first search from each unmatched row along the layers for vertex disjoint shortest augmenting paths, and flip every path found.
+    Step-3:	Repeat until the breadth first search reaches no unmatched column.
+
+    Return match_row, match_col and the layer of every row in the last search (-1 if it's not reachable from an unmatched row).
+
+    Source: J. E. Hopcroft and R. M. Karp, "An n^5/2 algorithm for maximum matchings in bipartite graphs", SIAM J. Comput. 2 (4), 1973.
+    """
+
+    n = len(indptr) - 1
+    indptr, indices = indptr.tolist(), indices.tolist()
+    match_row = [-1] * n
+    match_col = [-1] * m
+
+    while True:
+
+        #layer rows by breadth first search from the unmatched rows
+        dist = [-1] * n
+        queue = [i for i in range(n) if match_row[i] == -1]
+        for i in queue:
+            dist[i] = 0
+
+        found = False
+        for i in queue:
+            for j in indices[indptr[i]:indptr[i + 1]]:
+                r = match_col[j]
+                if r == -1:
+                    found = True
+                elif dist[r] == -1:
+                    dist[r] = dist[i] + 1
+                    queue.append(r)
+
+        if not found:
+            return match_row, match_col, dist
+
+        #augmenting paths by depth first search along the layers, ptr is the next edge to try of each row
+        ptr = indptr[:-1]
+        for s in range(n):
+            if match_row[s] != -1:
+                continue
+
+            stack, path = [s], []
+            while stack:
+                i = stack[-1]
+                if ptr[i] == indptr[i + 1]:
+                    #dead end, no shortest path goes through row i anymore
+                    dist[i] = -1
+                    stack.pop()
+                    if path:
+                        path.pop()
+                    continue
+
+                j = indices[ptr[i]]
+                ptr[i] += 1
+                r = match_col[j]
+
+                if r == -1:
+                    #flip the path, path[t] is the column between stack[t] and stack[t + 1]
+                    for a, b in zip(stack, path + [j]):
+                        match_row[a] = b
+                        match_col[b] = a
+                    break
+
+                if dist[r] == dist[i] + 1:
+                    path.append(j)
+                    stack.append(r)
+
+
+def minimum_line_cover(zeros):
+    """
+    Minimum number of lines (rows and columns) covering every zero of a table
+    By Konig's theorem it's the size of a maximum matching of rows to columns on the zero cells.
+    The lines are the rows not reachable and the columns reachable by alternating paths from the unmatched rows.
+
+    zeros is a boolean (n, m) array, return the number of lines and boolean masks of the covered rows and columns.
+    """
+
+    n, m = zeros.shape
+    row, col = np.nonzero(zeros)
+    indptr = np.concatenate([[0], np.cumsum(np.bincount(row, minlength=n))])
+
+    match_row, match_col, dist = maximum_matching(indptr, col, m)
+
+    #rows reachable from the unmatched rows and their columns
+    reach = np.array(dist) != -1
+    cols = np.zeros(m, dtype=bool)
+    cols[col[reach[row]]] = True
+    rows = ~reach
+
+    return int(rows.sum() + cols.sum()), rows, cols
+
@@ -0,0 +1,230 @@
+import numpy as np
+from transportation import Transportation, row_chunks
+from allocation import Allocation
+import registry
+
+class ModifiedDistribution:
+    """
+    Modified Distribution Method (MODI) or u-v method
+    Step-1:	Start from an initial basic feasible solution (from any of the initial solution methods). If it has less than n + m - 1 allocations (degenerate), add epsilon (zero) allocations until the allocated cells connect all rows and columns.
+    Step-2:	Find ui and vj for all rows and columns from ui + vj = cij of the allocated cells, starting with u0 = 0.
+    Step-3:	For each unallocated cell calculate dij = cij - (ui + vj).
+    Step-4:	If all dij >= 0, the solution is optimal. Otherwise select the cell having the most negative dij as entering cell.
+    Step-5:	Find the closed path (stepping stone cycle) from the entering cell through the allocated cells and mark it's corners +, -, +, - starting from the entering cell.
+    Step-6:	Let theta be the minimum allocation of the - cells. Add theta to the + cells and subtract it from the - cells, the - cell that becomes 0 leaves the basis.
+    Step-7:	Repeat from Step-2 until solution is optimal.
+
+    The allocated cells (basis) always form a spanning tree of rows and columns, so the closed path of the
+    entering cell is the tree path between it's row and column.
+    """
+
+    def __init__(self, trans, tol=1e-9):
+        self.trans = trans
+        #forbidden lanes of a sparse problem cost big-M, an artificial lane of the initial solution leaves the basis
+        #unless the problem is infeasible. a memory mapped cost is read from it's file instead of being copied
+        if trans.is_mapped:
+            self.cost = trans.cost
+        elif trans.is_sparse:
+            self.cost = np.array(trans.dense_cost(fill=trans.big_m()), dtype=float)
+        else:
+            self.cost = np.array(trans.cost, dtype=float)
+        self.n, self.m = self.cost.shape
+        self.tol = tol
+        self.pivots = 0
+
+    def basis(self, allocation):
+        n, m = self.n, self.m
+        if not isinstance(allocation, Allocation):
+            allocation = Allocation.from_labels(self.trans, allocation)
+
+        #union find of rows (0..n-1) and columns (n..n+m-1)
+        root = list(range(n + m))
+        def find(a):
+            while root[a] != a:
+                root[a] = root[root[a]]
+                a = root[a]
+            return a
+
+        #allocation of basic cells
+        self.flow = {}
+        for i, j, v in allocation.cells():
+            a, b = find(i), find(n + j)
+            if a == b:
+                raise ValueError("allocation is not a basic feasible solution")
+            root[a] = b
+            self.flow[i, j] = v
+
+        #degenerate solution, add epsilon cells with the lowest cost
+        #that connect two parts of the basis
+        if len(self.flow) < n + m - 1:
+            for c in self.cheapest():
+                i, j = divmod(int(c), m)
+                a, b = find(i), find(n + j)
+                if a != b:
+                    root[a] = b
+                    self.flow[i, j] = 0
+                    if len(self.flow) == n + m - 1:
+                        break
+
+        #basis tree as adjacency of rows and columns
+        self.adj = [set() for _ in range(n + m)]
+        for i, j in self.flow:
+            self.adj[i].add(n + j)
+            self.adj[n + j].add(i)
+
+    def cheapest(self):
+        #flat index of the cells by cost, a mapped cost is sorted row chunk by row chunk
+        if not self.trans.is_mapped:
+            yield from np.argsort(self.cost, axis=None, kind='stable')
+            return
+
+        for chunk in row_chunks(self.cost):
+            yield from chunk.start * self.m + np.argsort(self.cost[chunk], axis=None, kind='stable')
+
+    def entering(self, u, v):
+        #cell having the most negative dij = cij - (ui + vj) (first in row-wise order), scanned row chunk by row chunk
+        best = (0, 0, np.inf)
+        for chunk in row_chunks(self.cost):
+            d = self.cost[chunk] - u[chunk].reshape(-1, 1) - v
+            i, j = np.unravel_index(np.argmin(d), d.shape)
+            if d[i, j] < best[2]:
+                best = (chunk.start + i, j, d[i, j])
+        return best
+
+    def potentials(self):
+        #compute u and v from the basis tree rooted at row 0
+        n = self.n
+        u, v = np.zeros(self.n), np.zeros(self.m)
+
+        self.parent = [-1] * (self.n + self.m)
+        self.depth = [0] * (self.n + self.m)
+
+        stack = [0]
+        while stack:
+            a = stack.pop()
+            for b in self.adj[a]:
+                if b == self.parent[a]:
+                    continue
+                self.parent[b] = a
+                self.depth[b] = self.depth[a] + 1
+                if b >= n:
+                    v[b - n] = self.cost[a, b - n] - u[a]
+                else:
+                    u[b] = self.cost[b, a - n] - v[a - n]
+                stack.append(b)
+
+        return u, v
+
+    def cycle(self, i, j):
+        #tree path from column j to row i, with entering cell (i, j) it forms the closed path
+        a, b = i, self.n + j
+        left, right = [a], [b]
+        while a != b:
+            if self.depth[a] >= self.depth[b]:
+                a = self.parent[a]
+                left.append(a)
+            else:
+                b = self.parent[b]
+                right.append(b)
+        path = right + left[::-1][1:]
+
+        cells = []
+        for a, b in zip(path[:-1], path[1:]):
+            cells.append((b, a - self.n) if a >= self.n else (a, b - self.n))
+        return cells
+
+    def pivot(self, i, j):
+        #cells of the closed path alternate -, +, -, ... after the entering cell
+        cells = self.cycle(i, j)
+        minus, plus = cells[0::2], cells[1::2]
+
+        theta = min(self.flow[c] for c in minus)
+        leave = next(c for c in minus if self.flow[c] == theta)
+
+        for c in minus:
+            self.flow[c] -= theta
+        for c in plus:
+            self.flow[c] += theta
+
+        #swap leaving cell with entering cell in the basis
+        del self.flow[leave]
+        self.adj[leave[0]].discard(self.n + leave[1])
+        self.adj[self.n + leave[1]].discard(leave[0])
+
+        self.flow[i, j] = theta
+        self.adj[i].add(self.n + j)
+        self.adj[self.n + j].add(i)
+
+        self.pivots += 1
+
+    def allocation(self):
+        #basic cells with positive allocation
+        cells = [(i, j, v) for (i, j), v in sorted(self.flow.items()) if v > 0]
+        return Allocation.from_cells(self.trans, cells)
+
+    def feasible(self, allocation):
+        #optimal allocation still using a forbidden (big-M) lane, no allocation of the allowed lanes meets supply and demand
+        if self.trans.is_sparse and len(allocation):
+            _, allowed = self.trans.lanes(allocation.row, allocation.col)
+            if not allowed.all():
+                raise ValueError("problem is infeasible, {} units are left on forbidden lanes".format(allocation.value[~allowed].sum()))
+        return allocation
+
+    def solve(self, allocation, show_iter=False):
+
+        self.basis(allocation)
+
+        while True:
+
+            if show_iter:
+                self.trans.print_table(self.allocation())
+
+            #reduced cost of every cell, basic cells are 0
+            u, v = self.potentials()
+            i, j, d = self.entering(u, v)
+            if d >= -self.tol:
+                break
+
+            self.pivot(i, j)
+
+        return self.feasible(self.allocation())
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                    [16, 24, 16],
+                    [ 8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #find initial basic feasible solution with any of the initial solution methods (by class or registry name).
+    allocation = registry.solve("vam", trans)
+
+    #initialize MODI method with table that has been prepared before.
+    MODI = ModifiedDistribution(trans)
+
+    #improve initial allocation lists which consist n of (Ri, Cj, v) until it's optimal.
+    #show_iter=True will showing allocation table per pivot, default=False.
+    allocation = MODI.solve(allocation, show_iter=False)
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
+    print("PIVOTS: {}".format(MODI.pivots))
@@ -0,0 +1,220 @@
+import numpy as np
+from transportation import Transportation
+from modified_distribution import ModifiedDistribution
+import registry
+
+class NetworkSimplex(ModifiedDistribution):
+    """
+    Network Simplex Method for the transportation problem
+    Step-1:	Start from the basic feasible solution of an initial solution method (NWC, LCM, VAM, RAM, ...) and index it's basis tree (rooted at row 0) by parent, depth and thread (preorder successor) of every row and column.
+    Step-2:	Pricing: scan the cells block by block and select the most negative dij = cij - (ui + vj) of the first block having a negative one. If no block has, the solution is optimal.
+    Step-3:	Find the cycle of the entering cell by walking up the tree from it's row and column to their common ancestor, the edges on both sides alternate -, +, ... from the entering cell.
+    Step-4:	Shift theta (the minimum allocation of the - cells) around the cycle, the blocking - cell leaves the basis.
+    Step-5:	Re-hang the subtree cut off by the leaving cell under the entering cell, shifting only the potentials of that subtree and updating it's part of the thread. Return to Step-2.
+
+    Source: A. Löbel, "Solving large-scale real-world minimum-cost flow problems by a network simplex method", ZIB, 1996.
+    """
+
+    def __init__(self, trans, block_size=None, tol=1e-9):
+        super().__init__(trans, tol=tol)
+        self.block_size = block_size or max(int(np.sqrt(self.n * self.m)), 1)
+        self.next = 0
+
+    def edge_cost(self, a, b):
+        #cost of basic cell between node a and b
+        return self.cost[a, b - self.n] if a < self.n else self.cost[b, a - self.n]
+
+    def edge_cell(self, node):
+        #basic cell between node and it's parent
+        a = self.parent[node]
+        return (node, a - self.n) if node < self.n else (a, node - self.n)
+
+    def preorder(self, q):
+        #walk the subtree of q, setting parent and depth of it's nodes
+        order = []
+        stack = [q]
+        while stack:
+            a = stack.pop()
+            order.append(a)
+            for b in self.adj[a]:
+                if b != self.parent[a]:
+                    self.parent[b] = a
+                    self.depth[b] = self.depth[a] + 1
+                    stack.append(b)
+        return order
+
+    def build_tree(self):
+        N = self.n + self.m
+
+        self.parent = [-1] * N
+        self.depth = [0] * N
+        order = self.preorder(0)
+
+        #thread is a cyclic list of nodes in preorder, rev is it's reverse
+        self.thread = [0] * N
+        self.rev = [0] * N
+        for a, b in zip(order, order[1:] + order[:1]):
+            self.thread[a] = b
+            self.rev[b] = a
+
+        #potentials, ui for rows (0..n-1) and vj for columns (n..n+m-1)
+        self.pot = np.zeros(N)
+        for a in order[1:]:
+            self.pot[a] = self.edge_cost(a, self.parent[a]) - self.pot[self.parent[a]]
+
+    def price(self):
+        #block search pricing, resumes where the last search stopped
+        total = self.n * self.m
+        cost = self.cost.ravel()
+
+        for _ in range(total // self.block_size + 2):
+            start = self.next
+            stop = min(start + self.block_size, total)
+            self.next = stop % total
+
+            idx = np.arange(start, stop)
+            i, j = idx // self.m, idx % self.m
+            d = cost[start:stop] - self.pot[i] - self.pot[self.n + j]
+
+            k = np.argmin(d)
+            if d[k] < -self.tol:
+                return i[k], j[k], d[k]
+
+        return None
+
+    def pivot(self, i, j, d):
+        n = self.n
+
+        #walk up from row i and column j to their common ancestor
+        #edges are kept as their child node
+        side_i, side_j = [], []
+        a, b = i, n + j
+        while a != b:
+            if self.depth[a] >= self.depth[b]:
+                side_i.append(a)
+                a = self.parent[a]
+            else:
+                side_j.append(b)
+                b = self.parent[b]
+
+        minus = side_i[0::2] + side_j[0::2]
+        plus = side_i[1::2] + side_j[1::2]
+        theta = min(self.flow[self.edge_cell(c)] for c in minus)
+
+        #last blocking cell when going around the cycle from the common ancestor
+        for leave in side_j[::-1][(len(side_j) - 1) % 2::2] + side_i[0::2]:
+            if self.flow[self.edge_cell(leave)] == theta:
+                break
+
+        for c in minus:
+            self.flow[self.edge_cell(c)] -= theta
+        for c in plus:
+            self.flow[self.edge_cell(c)] += theta
+
+        #entering cell (i, j) hangs the subtree of leave at q under p
+        if leave in side_i[0::2]:
+            q, p = i, n + j
+        else:
+            q, p = n + j, i
+
+        #nodes of the subtree, they follow leave in the thread with a greater depth
+        last = leave
+        subtree = [leave]
+        while self.depth[self.thread[last]] > self.depth[leave]:
+            last = self.thread[last]
+            subtree.append(last)
+
+        #shift potentials of the subtree so entering cell gets dij = 0
+        subtree = np.array(subtree)
+        delta = d if q < n else -d
+        self.pot[subtree] += np.where(subtree < n, delta, -delta)
+
+        #swap leaving cell with entering cell in the basis
+        a = self.parent[leave]
+        del self.flow[self.edge_cell(leave)]
+        self.adj[leave].discard(a)
+        self.adj[a].discard(leave)
+
+        self.flow[i, j] = theta
+        self.adj[i].add(n + j)
+        self.adj[n + j].add(i)
+
+        #cut the subtree out of the thread
+        prev, nxt = self.rev[leave], self.thread[last]
+        self.thread[prev] = nxt
+        self.rev[nxt] = prev
+
+        #re-hang it under p, right after p in the thread
+        self.parent[q] = p
+        self.depth[q] = self.depth[p] + 1
+        order = self.preorder(q)
+
+        nxt = self.thread[p]
+        for a, b in zip([p] + order, order + [nxt]):
+            self.thread[a] = b
+            self.rev[b] = a
+
+        self.pivots += 1
+
+    def solve(self, initial="nwc", show_iter=False):
+
+        #warm start from an initial solution method (class or registry name) or given allocation lists
+        if isinstance(initial, (type, str)):
+            initial = registry.solve(initial, self.trans)
+
+        self.basis(initial)
+        self.build_tree()
+
+        while True:
+
+            if show_iter:
+                self.trans.print_table(self.allocation())
+
+            enter = self.price()
+            if enter is None:
+                break
+
+            self.pivot(*enter)
+
+        return self.feasible(self.allocation())
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                    [16, 24, 16],
+                    [ 8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    for method in ["nwc", "lcm", "vam", "russell"]:
+
+        #initialize network simplex with table that has been prepared before.
+        NS = NetworkSimplex(trans)
+
+        #solve problem starting from the initial solution of method, a class or registry name (or from given allocation lists)
+        #and return optimal allocation lists which consist n of (Ri, Cj, v).
+        #show_iter=True will showing allocation table per pivot, default=False.
+        allocation = NS.solve(initial=method, show_iter=False)
+
+        print("{} PIVOTS: {}".format(registry.class_name(method), NS.pivots))
+
+    #print out allocation table in the form of pandas DataFrame.
+    #(doesn't work well if problem has large dimension).
+    trans.print_table(allocation)
@@ -0,0 +1,194 @@
+import time
+import numpy as np
+import multiprocessing as mp
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from transportation import Transportation, Arcs
+from allocation import Allocation
+from registry import names, lookup, get, class_name
+
+#registry names of every initial solution method, a worker imports only the module of it's method
+METHODS = names()
+
+
+def run_method(method, meta, conn):
+    #worker process: attach problem arrays from shared memory and solve it with method
+    blocks = []
+    try:
+        arrays = []
+        for name, shape, dtype in meta["arrays"]:
+            shm = shared_memory.SharedMemory(name=name)
+            blocks.append(shm)
+            arrays.append(np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+        if meta["sparse"]:
+            #allowed lanes of a sparse problem
+            row, col, cost, supply, demand = arrays
+            arrays = [Arcs((len(supply), len(demand)), row, col, cost), supply, demand]
+
+        trans = Transportation(*arrays, copy=False)
+        trans.row_labels = meta["row_labels"]
+        trans.col_labels = meta["col_labels"]
+
+        alloc = get(method)(trans).solve()
+        total = alloc.total_cost()
+
+        #send index arrays only, the parent has the labels
+        cells = (alloc.row, alloc.col, alloc.value)
+        del trans, arrays, alloc
+        conn.send(("ok", total, cells))
+    except Exception as e:
+        conn.send(("error", repr(e), None))
+    finally:
+        for shm in blocks:
+            shm.close()
+        conn.close()
+
+
+class Portfolio:
+    """
+    Portfolio of initial solution methods
+    Run every method on the same transportation problem in separate processes, each with it's own timeout,
+    and rank them by total cost. The problem arrays (cost, supply and demand) are put once in shared memory
+    and every worker reads them from there instead of receiving a pickled copy.
+    Methods are classes or registry names ("vam", "russell", ...), a method given by name is only imported by it's worker.
+    """
+
+    def __init__(self, trans, methods=METHODS, processes=None, timeout=None):
+        self.trans = trans
+        self.methods = [method if isinstance(method, type) else lookup(method) for method in methods]
+        self.processes = processes or mp.cpu_count()
+        self.timeout = timeout
+
+        self.ranking = []
+        self.errors = {}
+        self.alloc = None
+
+    def share(self):
+        #copy problem arrays into shared memory blocks, the arcs (row, column, cost) of a sparse problem instead of it's cost
+        if self.trans.is_sparse:
+            data = list(self.trans.arcs()) + [self.trans.supply, self.trans.demand]
+        else:
+            data = [self.trans.cost, self.trans.supply, self.trans.demand]
+
+        self.blocks, arrays = [], []
+        for a in data:
+            a = np.ascontiguousarray(a)
+            shm = shared_memory.SharedMemory(create=True, size=max(a.nbytes, 1))
+            np.ndarray(a.shape, dtype=a.dtype, buffer=shm.buf)[...] = a
+            self.blocks.append(shm)
+            arrays.append((shm.name, a.shape, a.dtype.str))
+
+        return {
+            "arrays": arrays,
+            "sparse": self.trans.is_sparse,
+            "row_labels": list(self.trans.row_labels),
+            "col_labels": list(self.trans.col_labels),
+        }
+
+    def solve(self, show_iter=False):
+
+        meta = self.share()
+        results = {}
+        try:
+            pending = self.methods[::-1]
+            running = {}
+
+            while pending or running:
+
+                #start methods until all processes are busy
+                while pending and len(running) < self.processes:
+                    method = pending.pop()
+                    recv, send = mp.Pipe(duplex=False)
+                    proc = mp.Process(target=run_method, args=(method, meta, send), daemon=True)
+                    proc.start()
+                    send.close()
+                    running[recv] = (method, proc, time.perf_counter())
+
+                if self.timeout is None:
+                    timeout = None
+                else:
+                    now = time.perf_counter()
+                    timeout = max(min(start + self.timeout - now for _, _, start in running.values()), 0)
+
+                for conn in wait(list(running), timeout=timeout):
+                    method, proc, start = running.pop(conn)
+                    try:
+                        status, total, alloc = conn.recv()
+                    except EOFError:
+                        status, total, alloc = "error", "worker exited with code {}".format(proc.exitcode), None
+                    conn.close()
+                    proc.join()
+
+                    if status == "ok":
+                        results[class_name(method)] = (total, time.perf_counter() - start, Allocation(self.trans, *alloc))
+                    else:
+                        self.errors[class_name(method)] = total
+
+                    if show_iter:
+                        print("{}: {}".format(class_name(method), total))
+
+                #stop methods that ran out of time
+                now = time.perf_counter()
+                for conn, (method, proc, start) in list(running.items()):
+                    if self.timeout is not None and now - start >= self.timeout:
+                        proc.terminate()
+                        proc.join()
+                        conn.close()
+                        del running[conn]
+                        self.errors[class_name(method)] = "timeout"
+
+                        if show_iter:
+                            print("{}: timeout".format(class_name(method)))
+        finally:
+            for shm in self.blocks:
+                shm.close()
+                shm.unlink()
+
+        #rank methods by total cost, (name, total cost, seconds)
+        self.ranking = sorted([[name, total, seconds] for name, (total, seconds, _) in results.items()], key=lambda r: r[1])
+        if self.ranking:
+            self.alloc = results[self.ranking[0][0]][2]
+
+        return self.alloc
+
+
+if __name__ == "__main__":
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #example 2 unbalance problem
+    cost = np.array([[ 4,  8,  8],
+                    [16, 24, 16],
+                    [ 8, 16, 24]])
+    supply = np.array([76, 82, 77])
+    demand = np.array([72, 102, 41])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #initialize portfolio with table that has been prepared before.
+    #methods is list of method classes or registry names to run (default all), processes is number of worker processes
+    #and timeout is seconds given to each method.
+    portfolio = Portfolio(trans, processes=4, timeout=10)
+
+    #run all methods and return allocation of the method with minimum total cost.
+    allocation = portfolio.solve()
+
+    #ranking of methods as (name, total cost, seconds), methods that failed or timed out are in errors.
+    for name, total, seconds in portfolio.ranking:
+        print("{:30} {:>8} {:8.3f}s".format(name, total, seconds))
+    print(portfolio.errors)
+
+    #print out allocation table of the best method.
+    trans.print_table(allocation)
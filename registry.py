@@ -0,0 +1,98 @@
+import importlib
+
+#initial solution methods by name, as "module:Class" of the initial_methods package so a method's module is only imported when it's selected
+METHODS = {
+    "asm": "initial_methods.assigning_shortest_minimax:AssigningShortestMinimax",
+    "atoc": "initial_methods.average_total_opprtunity_cost:AverageTotalOpportunityCost",
+    "cm": "initial_methods.column_minima:ColumnMinima",
+    "gm": "initial_methods.global_minium_method:GlobalMinimum",
+    "hma": "initial_methods.harmonic_mean_approach:HarmonicMeanApproach",
+    "hm1": "initial_methods.heuristic_method_1:HeuristicMethod1",
+    "hm2": "initial_methods.heuristic_method_2:HeuristicMethod2",
+    "iea": "initial_methods.improved_exponential_approach:ImprovedExponentialApproach",
+    "ks": "initial_methods.karagul_sahin_approximation:KaragulSahinApproximation",
+    "lcm": "initial_methods.least_cost:LeastCost",
+    "mdma": "initial_methods.maximum_devide_minimum_allotment:MaximumDevideMinimumAllotment",
+    "msmc": "initial_methods.maximum_supply_minimum_cost:MaximumSupplyMinimumCost",
+    "nwc": "initial_methods.north_west_corner:NorthWestCorner",
+    "rm": "initial_methods.row_minima:RowMinima",
+    "russell": "initial_methods.russels_approximation:RussellsApproximationMethod",
+    "tam": "initial_methods.the_adavanced_method:TheAdvanceMethod",
+    "vam": "initial_methods.vogels_approximation:VogelsApproximationMethod",
+}
+
+#other names used for the same methods (abbreviations of the module examples)
+ALIASES = {
+    "ram": "russell",
+    "lc": "lcm",
+}
+
+
+def names():
+    return list(METHODS)
+
+
+def lookup(name):
+    #registry name of a method given by name, alias or class name (case insensitive), without importing it
+    key = name.lower()
+    key = ALIASES.get(key, key)
+    if key in METHODS:
+        return key
+
+    for key, path in METHODS.items():
+        if path.split(":")[1].lower() == name.lower():
+            return key
+
+    raise KeyError("unknown method {}, available: {}".format(name, ", ".join(METHODS)))
+
+
+def class_name(method):
+    #class name of a method class or name, without importing it
+    if isinstance(method, type):
+        return method.__name__
+    return METHODS[lookup(method)].split(":")[1]
+
+
+def get(method):
+    #method class of a name, only the module of that method is imported, classes are returned as they are
+    if isinstance(method, type):
+        return method
+
+    module, cls = METHODS[lookup(method)].split(":")
+    return getattr(importlib.import_module(module), cls)
+
+
+def solve(method, trans, show_iter=False, **kwargs):
+    #solve trans with a method class or name, every method has the same interface of AllocationEngine
+    return get(method)(trans).solve(show_iter=show_iter, **kwargs)
+
+
+if __name__ == "__main__":
+
+    import sys
+    import numpy as np
+    from transportation import Transportation
+
+    #example 1 balance problem
+    cost = np.array([[19, 30, 50, 10],
+                    [70, 30, 40, 60],
+                    [40,  8, 70, 20]])
+    supply = np.array([7, 9, 18])
+    demand = np.array([5, 8, 7, 14])
+
+    #initialize transportation problem
+    trans = Transportation(cost, supply, demand)
+
+    #setup transportation table.
+    #minimize=True for minimization problem, change to False for maximization, default=True.
+    #ignore this if problem is minimization and already balance
+    trans.setup_table(minimize=True)
+
+    #solve problem with a method selected by name, only vogels_approximation is imported.
+    #names(), e.g. "vam", "russell", "lcm", "asm", "iea", "ks", "nwc", "gm", alias or class name can be used
+    allocation = solve("vam", trans)
+    print(class_name("vam"), allocation.total_cost())
+    print([module for module in ["initial_methods.least_cost", "initial_methods.russels_approximation"] if module in sys.modules])
+
+    #print out allocation table.
+    trans.print_table(allocation)
@@ -0,0 +1,316 @@
+import json
+import time
+import signal
+import argparse
+import numpy as np
+import multiprocessing as mp
+import registry
+from cli import from_record, solve
+from batch_transportation import BatchTransportation
+
+#asyncio and concurrent.futures are imported by the methods running the service, so a worker (or import_check)
+#importing this module for solve_one and solve_batch doesn't load them
+
+#methods of BatchTransportation, small problems of these are solved together
+BATCH_METHODS = ["nwc", "lcm", "vam", "russell"]
+
+#upper bounds (seconds) of the latency histogram buckets
+BUCKETS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf")]
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+           422: "Unprocessable Entity", 503: "Service Unavailable"}
+
+
+def solve_one(cost, supply, demand, method, optimal, minimize):
+    #worker process: allocation of one problem as lists
+    row, col, value, total = solve(cost, supply, demand, method, optimal, minimize)
+    return row.tolist(), col.tolist(), value.tolist(), total
+
+
+def solve_batch(problems, method, minimize):
+    #worker process: allocations of small (cost, supply, demand) problems of the same shape solved together with BatchTransportation
+    cost = np.array([c if minimize else c.max() - c for c, _, _ in problems], dtype=float)
+    supply = np.stack([s for _, s, _ in problems])
+    demand = np.stack([d for _, _, d in problems])
+
+    alloc, _ = BatchTransportation(cost, supply, demand).solve(method=method)
+
+    results = []
+    for a, (c, _, _) in zip(alloc, problems):
+        row, col = np.nonzero(a)
+        value = a[row, col]
+        results.append((row.tolist(), col.tolist(), value.tolist(), (value * c[row, col]).sum().item()))
+    return results
+
+
+class Histogram:
+    """
+    Latency histogram, count of observations up to each bucket bound (cumulative), their sum and count.
+    """
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = list(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        for k, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[k] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+class SolveService:
+    """
+    Local HTTP solve service
+    POST /solve takes a problem as json {"cost", "supply", "demand", "method" (registry name, default "vam"),
+    "optimal", "maximize"} and returns it's allocation {"method", "total_cost", "row", "col", "value", "seconds"},
+    without dummy row/column. Problems are solved in a pool of worker processes.
+    Problems of a batch method (nwc, lcm, vam, russell) with at most batch_cells cells that aren't solved to optimality
+    wait up to batch_delay seconds for others of the same method and shape, and are solved together with BatchTransportation
+    (up to batch_size at a time). Batches are grouped by shape, so their problems are stacked without padding.
+    At most max_pending problems are admitted at once, the others get 503 until some are done.
+    GET /metrics returns latency histograms per method and counters in prometheus text format, GET /health the load.
+    """
+
+    def __init__(self, processes=None, max_pending=1000, batch_size=256, batch_delay=0.002, batch_cells=400, max_body=2**24):
+        self.processes = processes
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.batch_cells = batch_cells
+        self.max_body = max_body
+
+        self.pool = None
+        self.pending = 0
+
+        #problems waiting for their batch, by (method, minimize, shape)
+        self.batches = {}
+        self.timers = {}
+
+        self.latency = {}
+        self.requests = {}
+        self.rejected = 0
+        self.batch_count = 0
+        self.batch_problems = 0
+
+    async def serve(self, host="127.0.0.1", port=8080):
+        import asyncio
+        from concurrent.futures import ProcessPoolExecutor
+
+        #spawned workers don't inherit the listening socket of the server
+        self.pool = ProcessPoolExecutor(max_workers=self.processes, mp_context=mp.get_context("spawn"))
+        server = await asyncio.start_server(self.handle, host, port)
+
+        #stop on SIGTERM like on ctrl-c, so the worker processes are shut down with the pool
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.pool.shutdown(cancel_futures=True)
+
+    async def handle(self, reader, writer):
+        #http/1.1 connection, requests are answered in order until the client closes it
+        import asyncio
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+
+                lines = head.decode("latin-1").split("\r\n")
+                verb, path, version = (lines[0].split(" ") + ["", "", ""])[:3]
+                headers = {}
+                for line in lines[1:]:
+                    if ":" in line:
+                        key, value = line.split(":", 1)
+                        headers[key.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get("content-length", 0) or 0)
+                    if length < 0:
+                        raise ValueError
+                except ValueError:
+                    #the body can't be framed, so the connection can't be used for another request
+                    await self.respond(writer, 400, {"error": "invalid Content-Length {!r}".format(headers["content-length"])}, close=True)
+                    break
+                if length > self.max_body:
+                    await self.respond(writer, 413, {"error": "body over {} bytes".format(self.max_body)}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, payload = await self.route(verb, path, body)
+                close = headers.get("connection", "").lower() == "close" or version == "HTTP/1.0"
+                await self.respond(writer, status, payload, close=close)
+                if close:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            #client went away, or the service is stopping
+            pass
+        finally:
+            writer.close()
+
+    async def respond(self, writer, status, payload, close=False):
+        if isinstance(payload, str):
+            body, kind = payload.encode(), "text/plain; version=0.0.4"
+        else:
+            body, kind = json.dumps(payload).encode(), "application/json"
+
+        head = ["HTTP/1.1 {} {}".format(status, REASONS.get(status, "")), "Content-Type: " + kind,
+                "Content-Length: {}".format(len(body)), "Connection: " + ("close" if close else "keep-alive")]
+        if status == 503:
+            head.append("Retry-After: 1")
+        writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+        await writer.drain()
+
+    async def route(self, verb, path, body):
+        #(status, json payload or text) of a request
+        path = path.split("?", 1)[0]
+        if path == "/solve":
+            if verb != "POST":
+                return 405, {"error": "use POST"}
+            return await self.solve_request(body)
+        if path == "/metrics" and verb == "GET":
+            return 200, self.metrics()
+        if path == "/health" and verb == "GET":
+            return 200, {"status": "ok", "pending": self.pending, "max_pending": self.max_pending}
+        return 404, {"error": "no route {} {}".format(verb, path)}
+
+    async def solve_request(self, body):
+        import asyncio
+
+        #backpressure, the request is rejected before it's parsed
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            return 503, {"error": "{} problems pending, try again later".format(self.pending)}
+
+        try:
+            record = json.loads(body)
+            cost, supply, demand = from_record(record)
+            method = registry.lookup(record.get("method", "vam"))
+            optimal = bool(record.get("optimal", False))
+            minimize = not record.get("maximize", False)
+            if cost.ndim != 2 or supply.shape != cost.shape[:1] or demand.shape != cost.shape[1:]:
+                raise ValueError("cost {} doesn't match supply {} and demand {}".format(cost.shape, supply.shape, demand.shape))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.count(None, "invalid")
+            return 400, {"error": str(e)}
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            if method in BATCH_METHODS and not optimal and cost.size <= self.batch_cells:
+                row, col, value, total = await self.batched(cost, supply, demand, method, minimize)
+            else:
+                loop = asyncio.get_running_loop()
+                row, col, value, total = await loop.run_in_executor(self.pool, solve_one, cost, supply, demand, method, optimal, minimize)
+        except Exception as e:
+            self.count(method, "error")
+            return 422, {"error": repr(e)}
+        finally:
+            self.pending -= 1
+
+        seconds = time.perf_counter() - start
+        self.latency.setdefault(method, Histogram()).observe(seconds)
+        self.count(method, "ok")
+
+        return 200, {"method": registry.class_name(method), "total_cost": total, "row": row, "col": col, "value": value, "seconds": seconds}
+
+    def batched(self, cost, supply, demand, method, minimize):
+        #future of the allocation, solved with the other problems of it's batch.
+        #problems of other shapes go to other batches, padding e.g. a 1x400 and a 400x1 problem together would solve 400x400
+        import asyncio
+        key = (method, minimize, cost.shape)
+        future = asyncio.get_running_loop().create_future()
+        self.batches.setdefault(key, []).append((cost, supply, demand, future))
+
+        if len(self.batches[key]) >= self.batch_size:
+            self.flush(key)
+        elif key not in self.timers:
+            self.timers[key] = asyncio.get_running_loop().call_later(self.batch_delay, self.flush, key)
+        return future
+
+    def flush(self, key):
+        #send waiting problems of key to a worker as one batch
+        import asyncio
+        timer = self.timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self.batches.pop(key, [])
+        if items:
+            asyncio.ensure_future(self.run_batch(key, items))
+
+    async def run_batch(self, key, items):
+        import asyncio
+        method, minimize, _ = key
+        futures = [future for _, _, _, future in items]
+
+        self.batch_count += 1
+        self.batch_problems += len(items)
+        try:
+            loop = asyncio.get_running_loop()
+            problems = [(cost, supply, demand) for cost, supply, demand, _ in items]
+            results = await loop.run_in_executor(self.pool, solve_batch, problems, method, minimize)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+    def count(self, method, status):
+        key = (method or "", status)
+        self.requests[key] = self.requests.get(key, 0) + 1
+
+    def metrics(self):
+        #prometheus text format
+        lines = ["# TYPE solve_latency_seconds histogram"]
+        for method, hist in sorted(self.latency.items()):
+            for bound, count in zip(hist.buckets, hist.counts):
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append('solve_latency_seconds_bucket{{method="{}",le="{}"}} {}'.format(method, le, count))
+            lines.append('solve_latency_seconds_sum{{method="{}"}} {}'.format(method, hist.sum))
+            lines.append('solve_latency_seconds_count{{method="{}"}} {}'.format(method, hist.count))
+
+        lines.append("# TYPE solve_requests_total counter")
+        for (method, status), count in sorted(self.requests.items()):
+            lines.append('solve_requests_total{{method="{}",status="{}"}} {}'.format(method, status, count))
+
+        lines += [
+            "# TYPE solve_rejected_total counter", "solve_rejected_total {}".format(self.rejected),
+            "# TYPE solve_batches_total counter", "solve_batches_total {}".format(self.batch_count),
+            "# TYPE solve_batch_problems_total counter", "solve_batch_problems_total {}".format(self.batch_problems),
+            "# TYPE solve_pending gauge", "solve_pending {}".format(self.pending),
+        ]
+        return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="local http solve service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--processes", type=int, help="worker processes, default number of cpus")
+    parser.add_argument("--max-pending", type=int, default=1000, help="problems admitted at once, others get 503")
+    parser.add_argument("--batch-size", type=int, default=256, help="most problems solved in one batch")
+    parser.add_argument("--batch-delay", type=float, default=0.002, help="seconds a small problem waits for it's batch")
+    parser.add_argument("--batch-cells", type=int, default=400, help="most cells of a problem that is batched")
+    args = parser.parse_args()
+
+    import asyncio
+
+    #run the service, then e.g.
+    #curl -d '{"cost": [[4, 8, 8], [16, 24, 16], [8, 16, 24]], "supply": [76, 82, 77], "demand": [72, 102, 41], "method": "vam"}' localhost:8080/solve
+    #curl localhost:8080/metrics
+    service = SolveService(args.processes, args.max_pending, args.batch_size, args.batch_delay, args.batch_cells)
+    try:
+        asyncio.run(service.serve(args.host, args.port))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
@@ -1,67 +1,247 @@
+import tempfile
 import numpy as np
-import pandas as pd
+from allocation import Allocation
+
+#bytes of a memory mapped cost matrix read at once by chunked scans
+CHUNK = 2**26
+
+
+def row_chunks(cost, chunk=None):
+    #slices of consecutive rows of cost, each about chunk (default CHUNK) bytes
+    n, m = cost.shape
+    step = max((chunk or CHUNK) // max(m * cost.itemsize, 1), 1)
+    for a in range(0, n, step):
+        yield slice(a, min(a + step, n))
+
+
+def load_cost(path, shape=None, dtype=np.float32, offset=0):
+    #memory mapped (read only) cost matrix of a npy file, or of a raw binary file of given shape and dtype
+    if str(path).endswith(".npy"):
+        return np.load(path, mmap_mode='r')
+
+    if shape is None:
+        raise ValueError("shape of raw cost file {} is needed".format(path))
+    return np.memmap(path, dtype=dtype, mode='r', offset=offset, shape=tuple(shape))
+
+
+def mapped(shape, dtype):
+    #writable memory mapped array on a temporary file, removed once the array is no longer used
+    return np.memmap(tempfile.TemporaryFile(), dtype=dtype, mode='w+', shape=shape)
+
+
+class Arcs:
+    #sparse cost given by it's allowed lanes as (row, column, cost) arrays, read by Transportation like a scipy coo matrix
+    def __init__(self, shape, row, col, data):
+        self.shape = tuple(shape)
+        self.row, self.col, self.data = row, col, data
+
+    def tocoo(self):
+        return self
+
 
 class Transportation:
 
-    def __init__(self, cost, supply, demand):
+    def __init__(self, cost, supply, demand, copy=True):
 
         self.n, self.m = cost.shape
 
-        self.table = np.zeros((self.n + 2, self.m + 2), dtype=object)
-        self.table[1:-1, 1:-1] = cost.copy()
-        self.table[-1, 1:-1] = demand.copy()
-        self.table[1:-1, -1] = supply.copy()
-        self.table[0, 1::] = [f"C{i}" for i in range(self.m)] + ['Supply']
-        self.table[1::, 0] = [f"R{i}" for i in range(self.n)] + ['Demand']
+        #numeric problem data, kept apart from the labels so solvers
+        #work on native arrays instead of a dtype=object table.
+        #copy=False uses the given arrays as they are (e.g. arrays on shared memory)
+        array = np.array if copy else np.asarray
+        self.supply = array(supply)
+        self.demand = array(demand)
+
+        if hasattr(cost, "tocoo"):
+            #sparse cost (e.g. scipy.sparse coo/csr matrix), only stored entries are allowed lanes.
+            #lanes are kept as arcs (row, column, cost) in row-wise order
+            coo = cost.tocoo()
+            order = np.lexsort((coo.col, coo.row))
+            self.cost = None
+            self.arc_row = np.asarray(coo.row, dtype=np.intp)[order]
+            self.arc_col = np.asarray(coo.col, dtype=np.intp)[order]
+            self.arc_cost = np.asarray(coo.data)[order]
+        elif isinstance(cost, np.memmap):
+            #memory mapped cost (see load_cost) is read from it's file, never copied
+            self.cost = cost
+        else:
+            self.cost = array(cost, order='C')
+
+        #label index of rows and columns
+        self.row_labels = [f"R{i}" for i in range(self.n)]
+        self.col_labels = [f"C{j}" for j in range(self.m)]
+
+    @classmethod
+    def from_file(cls, path, supply, demand, shape=None, dtype=np.float32, offset=0):
+        #problem with a memory mapped cost matrix of a npy or raw binary file (see load_cost)
+        return cls(load_cost(path, shape, dtype, offset), supply, demand)
+
+    @property
+    def is_sparse(self):
+        return self.cost is None
+
+    @property
+    def is_mapped(self):
+        return isinstance(self.cost, np.memmap)
+
+    def arcs(self):
+        #allowed lanes as (row, column, cost) arrays in row-wise order,
+        #every cell is a lane of a dense problem
+        if self.is_sparse:
+            return self.arc_row, self.arc_col, self.arc_cost
+
+        n, m = self.cost.shape
+        return np.repeat(np.arange(n), m), np.tile(np.arange(m), n), self.cost.ravel()
+
+    def lanes(self, row, col):
+        #arc of every cell (row, col) of a sparse problem and whether the cell is an allowed lane
+        m = len(self.demand)
+        keys = self.arc_row.astype(np.int64) * m + self.arc_col
+        cells = np.asarray(row, dtype=np.int64) * m + col
+        lane = np.minimum(np.searchsorted(keys, cells), len(keys) - 1)
+        return lane, keys[lane] == cells
+
+    def big_m(self):
+        #cost of a forbidden lane used as artificial lane, more than any cycle of allowed lanes can save,
+        #so MODI / network simplex drive every artificial lane out when the problem is feasible
+        n, m = len(self.supply), len(self.demand)
+        return 2 * (n + m) * (np.abs(self.arc_cost).max(initial=0) + 1)
+
+    def dense_cost(self, fill=np.inf):
+        #cost matrix, forbidden lanes of a sparse problem get fill
+        if not self.is_sparse:
+            return self.cost
+
+        dtype = object if isinstance(fill, str) else np.result_type(self.arc_cost, fill)
+        cost = np.full((len(self.supply), len(self.demand)), fill, dtype=dtype)
+        cost[self.arc_row, self.arc_col] = self.arc_cost
+        return cost
+
+    @property
+    def table(self):
+        #object table (labels, cost, supply and demand) built on demand,
+        #only used for printing
+        n, m = len(self.supply), len(self.demand)
+        return self.build_table(self.dense_cost(fill='-'), self.supply, self.demand, range(n), range(m))
+
+    def build_table(self, cost, supply, demand, rows, cols):
+        #object table of cost[rows, cols] with it's labels and rim values
+        rows = np.array(list(rows), dtype=int)
+        cols = np.array(list(cols), dtype=int)
+
+        table = np.zeros((len(rows) + 2, len(cols) + 2), dtype=object)
+        table[1:-1, 1:-1] = cost[np.ix_(rows, cols)]
+        table[-1, 1:-1] = demand[cols]
+        table[1:-1, -1] = supply[rows]
+        table[-1, -1] = supply[rows].sum()
+        table[0, 1::] = [self.col_labels[j] for j in cols] + ['Supply']
+        table[1::, 0] = [self.row_labels[i] for i in rows] + ['Demand']
+        return table
 
     def setup_table(self, minimize=True):
-        
+
         if not minimize:
             #if problem is maximization then change to minimization
             #by substracting all cost from maximum cost
-            cost = self.table[1:-1, 1:-1]
-            self.table[1:-1, 1:-1] = np.max(cost) - cost
-        
+            if self.is_sparse:
+                self.arc_cost = np.max(self.arc_cost) - self.arc_cost
+            elif self.is_mapped:
+                top = max(self.cost[chunk].max() for chunk in row_chunks(self.cost))
+                self.cost = self.map_cost(lambda block: top - block)
+            else:
+                self.cost = np.max(self.cost) - self.cost
+
         #sum(supply) - sum(demand)
-        gap = self.table[1:-1, -1].sum() - self.table[-1, 1:-1].sum()
+        gap = self.supply.sum() - self.demand.sum()
 
-        if gap > 0:
+        if self.is_sparse:
+            self.setup_arcs(gap)
+        elif self.is_mapped and gap != 0:
+            #dummy row/column of a mapped cost, the padded cost is mapped on a temporary file
+            self.cost = self.map_cost(lambda block: block, int(gap < 0), int(gap > 0))
+            if gap > 0:
+                self.demand = np.append(self.demand, gap)
+                self.col_labels.append('Dummy')
+            else:
+                self.supply = np.append(self.supply, -gap)
+                self.row_labels.append('Dummy')
+        elif gap > 0:
             #add dummy column
-            dummy = np.array(['Dummy'] + ([0] * self.n) + [gap], dtype=object)
-            self.table = np.insert(self.table, -1, dummy, axis=1)
+            dummy = np.zeros((self.cost.shape[0], 1), dtype=self.cost.dtype)
+            self.cost = np.ascontiguousarray(np.hstack([self.cost, dummy]))
+            self.demand = np.append(self.demand, gap)
+            self.col_labels.append('Dummy')
         elif gap < 0:
             #add dummy row
-            dummy = np.array(['Dummy'] + ([0] * self.m) + [-gap], dtype=object)
-            self.table = np.insert(self.table, -1, dummy, axis=0)
+            dummy = np.zeros((1, self.cost.shape[1]), dtype=self.cost.dtype)
+            self.cost = np.ascontiguousarray(np.vstack([self.cost, dummy]))
+            self.supply = np.append(self.supply, -gap)
+            self.row_labels.append('Dummy')
 
-        self.table[-1, -1] = self.table[1:-1, -1].sum()
-        self.table = np.array(self.table,  dtype=object)
+    def map_cost(self, func, rows=0, cols=0):
+        #func(block) of the mapped cost, row chunk by chunk, into a temporary mapped file
+        #with rows/cols extra (dummy) rows and columns, a new file reads as zeros so they cost 0
+        n, m = self.cost.shape
+        cost = mapped((n + rows, m + cols), self.cost.dtype)
+        for chunk in row_chunks(self.cost):
+            cost[chunk, :m] = func(self.cost[chunk])
+        cost.flush()
+        return cost
+
+    def setup_arcs(self, gap):
+        #dummy row/column of a sparse problem, every lane to/from dummy is allowed
+        n, m = len(self.supply), len(self.demand)
+
+        if gap > 0:
+            row, col = np.arange(n), np.full(n, m)
+            self.demand = np.append(self.demand, gap)
+            self.col_labels.append('Dummy')
+        elif gap < 0:
+            row, col = np.full(m, n), np.arange(m)
+            self.supply = np.append(self.supply, -gap)
+            self.row_labels.append('Dummy')
+        else:
+            return
+
+        row = np.append(self.arc_row, row)
+        col = np.append(self.arc_col, col)
+        cost = np.append(self.arc_cost, np.zeros(len(row) - len(self.arc_row), dtype=self.arc_cost.dtype))
+
+        order = np.lexsort((col, row))
+        self.arc_row, self.arc_col, self.arc_cost = row[order], col[order], cost[order]
 
     def print_frame(self, table):
+        #pandas is only loaded when a table is printed, importing a method needs numpy only
+        import pandas as pd
+
         df = pd.DataFrame(table[1:, 1:])
         df.columns = table[0, 1:]
         df.index = table[1:, 0]
         print(df, '\n')
 
     def print_table(self, allocation):
-        alloc = [[i, j] for i, j, _ in allocation]
-        
+        if not isinstance(allocation, Allocation):
+            allocation = Allocation.from_labels(self, allocation)
+
+        #labels are only needed here, cells are looked up by index
+        alloc = {(i, j): v for i, j, v in allocation.cells()}
+        cost_matrix = self.dense_cost(fill='-')
+
         cost, total = [], 0
-        for i, x in enumerate(self.table[1:-1, 0]):
+        for i in range(len(self.row_labels)):
             temp = []
-            for j, y in enumerate(self.table[0, 1:-1]):
-                v = self.table[i + 1, j + 1]
-                try:
-                    z = alloc.index([x, y])
-                    cell = f"{v}({allocation[z, -1]})"
-                    total += v * allocation[z, -1]
-                except ValueError:
+            for j in range(len(self.col_labels)):
+                v = cost_matrix[i, j]
+                if (i, j) in alloc:
+                    cell = f"{v}({alloc[i, j]})"
+                    total += v * alloc[i, j]
+                else:
                     cell = f"{v}"
                 temp.append(cell)
             cost.append(temp)
 
-        table = self.table.copy()
+        table = self.table
         table[1:-1, 1:-1] = cost
 
-        self.print_frame(np.array(table))
+        self.print_frame(table)
         print("TOTAL COST: {}".format(total))